@@ -9,7 +9,7 @@ import ctypes
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import Qt, QSettings
 from PySide6.QtGui import QIcon
-from src.ui.main_window import MainWindow
+from src.ui.main_window import MainWindow, WINDOW_ICON_PATH
 from src.ui.styles import apply_dark_theme
 
 
@@ -38,17 +38,9 @@ def main():
     app.setApplicationName("Modbus Viewer")
     app.setOrganizationName("ModbusViewer")
     
-    # Set window icon if it exists
-    icon_paths = [
-        os.path.join(os.path.dirname(__file__), "assets", "icon.ico"),
-        os.path.join(os.path.dirname(__file__), "assets", "icon.png"),
-        os.path.join(os.path.dirname(__file__), "icon.ico"),
-        os.path.join(os.path.dirname(__file__), "icon.png"),
-    ]
-    for path in icon_paths:
-        if os.path.exists(path):
-            app.setWindowIcon(QIcon(path))
-            break
+    # Set window icon if it exists (path is resolved once when main_window is imported)
+    if WINDOW_ICON_PATH:
+        app.setWindowIcon(QIcon(WINDOW_ICON_PATH))
     
     # Apply dark theme
     apply_dark_theme(app)
@@ -6,8 +6,9 @@ Supports multiple devices on the same serial bus.
 import time
 import threading
 from typing import List, Optional, Dict, Tuple
-from dataclasses import dataclass
+from bisect import bisect_left
 from collections import deque
+from itertools import islice
 
 from PySide6.QtCore import QObject, Signal, Slot
 
@@ -17,13 +18,6 @@ from src.core.modbus_manager import ModbusManager
 from src.core.variable_engine import VariableEvaluator
 
 
-@dataclass
-class DataPoint:
-    """A single data point for plotting."""
-    timestamp: float
-    value: float
-
-
 class DataEngine(QObject):
     """
     Engine for polling Modbus registers and emitting data updates.
@@ -55,10 +49,12 @@ class DataEngine(QObject):
         self._stop_event = threading.Event()
         self._poll_thread: Optional[threading.Thread] = None
         self._write_lock = threading.Lock()
+        # Separate lock for history buffers so the GUI never waits on serial I/O
+        self._history_lock = threading.Lock()
         
-        # Data history for plotting (designator -> deque of DataPoints)
+        # Data history for plotting (designator -> (timestamps deque, values deque))
         # Keys are like "D1.R0" for registers, "var_name" for variables
-        self._history: Dict[str, deque] = {}
+        self._history: Dict[str, Tuple[deque, deque]] = {}
         self._history_max_seconds = 300  # 5 minutes max history
         
         # Statistics
@@ -80,6 +76,11 @@ class DataEngine(QObject):
     def set_poll_interval(self, ms: int) -> None:
         self._poll_interval = ms
     
+    @property
+    def last_poll_duration(self) -> float:
+        """Duration of the last successful poll cycle in ms."""
+        return self._last_poll_duration
+    
     @property
     def is_running(self) -> bool:
         return self._is_running
@@ -89,12 +90,14 @@ class DataEngine(QObject):
         with self._write_lock:
             self.registers = registers
             self._rebuild_batches()
+            # Register lookups only change with the register list, not the variables
+            self.variable_evaluator.set_registers(registers)
             
             # Initialize history for new registers
             for reg in registers:
                 key = reg.designator  # e.g., "D1.R0"
                 if key not in self._history:
-                    self._history[key] = deque()
+                    self._history[key] = (deque(), deque())
     
     def _rebuild_batches(self) -> None:
         """Rebuild polling batches grouped by slave_id."""
@@ -124,12 +127,11 @@ class DataEngine(QObject):
         """Set variables to evaluate."""
         with self._write_lock:
             self.variables = variables
-            self.variable_evaluator.set_registers(self.registers)
             # Initialize history for new variables
             for var in variables:
                 key = var.designator
                 if key not in self._history:
-                    self._history[key] = deque()
+                    self._history[key] = (deque(), deque())
     
     def start(self) -> None:
         """Start polling thread."""
@@ -160,18 +162,21 @@ class DataEngine(QObject):
             # Perform poll
             if self._poll():
                 # Success
-                duration = (time.perf_counter() - loop_start) * 1000
-                self._last_poll_duration = duration
+                now = time.perf_counter()
+                self._last_poll_duration = (now - loop_start) * 1000
                 
                 # Throttle GUI updates to ~30 FPS to save CPU and keep UI responsive
-                now = time.time()
                 if now - last_gui_update >= GUI_UPDATE_INTERVAL:
                     self.data_updated.emit()
                     last_gui_update = now
+            elif not self._is_running:
+                # Connection lost was reported once; don't keep re-emitting it
+                break
             
             # Minimal sleep to allow serial bus turnaround (Modbus RTU silent interval)
-            # Even at high speed, most devices need 2-5ms to reset their state machine
-            time.sleep(0.005)
+            # Even at high speed, most devices need 2-5ms to reset their state machine.
+            # Waiting on the stop event lets stop() wake the thread immediately.
+            self._stop_event.wait(0.005)
     
     def _poll(self) -> bool:
         """Single poll cycle - polls all devices."""
@@ -268,26 +273,32 @@ class DataEngine(QObject):
 
     def _update_register_values(self, registers: List[Register], raw_values: List[int], start_addr: int, now: float) -> None:
         """Helper to map raw values back to registers and update their state."""
+        # Bind lookups once; this runs for every batch on every poll
+        count = len(raw_values)
+        combine_registers = self.modbus._combine_registers
+        append_history = self._append_history
+        
         for reg in registers:
             # Calculate offset within the raw values list
             offset = reg.address - start_addr
-            if offset < 0 or offset >= len(raw_values):
+            if offset < 0 or offset >= count:
                 continue
                 
             try:
-                if reg.size == 1:
+                size = reg.size
+                if size == 1:
                     raw_val = raw_values[offset]
                 else:
-                    if offset + reg.size > len(raw_values):
+                    if offset + size > count:
                         continue
-                    chunk = raw_values[offset:offset + reg.size]
-                    raw_val = self.modbus._combine_registers(chunk, reg.byte_order)
+                    raw_val = combine_registers(raw_values[offset:offset + size], reg.byte_order)
                 
+                scaled_value = reg.apply_scale(raw_val)
                 reg.raw_value = raw_val
                 reg.error = None
                 reg.previous_value = reg.scaled_value
-                reg.scaled_value = reg.apply_scale(raw_val)
-                self._append_history(reg.designator, reg.scaled_value, now)
+                reg.scaled_value = scaled_value
+                append_history(reg.designator, scaled_value, now)
             except Exception as e:
                 reg.error = str(e)
 
@@ -328,15 +339,19 @@ class DataEngine(QObject):
     def _append_history(self, key: str, value: float, timestamp: float) -> None:
         """Append value to history buffer."""
         if key in self._history and value is not None:
-            self._history[key].append(DataPoint(timestamp=timestamp, value=value))
-            self._trim_history(key, timestamp)
+            with self._history_lock:
+                timestamps, values = self._history[key]
+                timestamps.append(timestamp)
+                values.append(value)
+                self._trim_history(key, timestamp)
 
     def _trim_history(self, key: str, now: float) -> None:
         """Trim old data from history."""
-        history = self._history[key]
+        timestamps, values = self._history[key]
         cutoff = now - self._history_max_seconds
-        while history and history[0].timestamp < cutoff:
-            history.popleft()
+        while timestamps and timestamps[0] < cutoff:
+            timestamps.popleft()
+            values.popleft()
 
     def get_history_arrays(self, key: str, window_seconds: float) -> Tuple[List[float], List[float]]:
         """Get history data as two lists (times relative to now, values)."""
@@ -346,17 +361,15 @@ class DataEngine(QObject):
         now = time.time()
         cutoff = now - window_seconds
         
-        times = []
-        values = []
-        
-        with self._write_lock:
-            history = self._history[key]
-            for dp in history:
-                if dp.timestamp >= cutoff:
-                    times.append(dp.timestamp - now)
-                    values.append(dp.value)
+        with self._history_lock:
+            timestamps, values = self._history[key]
+            # Timestamps are in time order: copy them out at C speed and
+            # bisect to the window edge instead of testing every sample
+            all_times = list(timestamps)
+            start = bisect_left(all_times, cutoff)
+            window_values = list(islice(values, start, None))
         
-        return times, values
+        return [t - now for t in all_times[start:]], window_values
 
     def write_register(self, register: Register, value: float) -> bool:
         """Write value to register, with locking to prevent thread conflicts."""
@@ -375,9 +388,10 @@ class DataEngine(QObject):
     
     def clear_history(self) -> None:
         """Clear all history data."""
-        with self._write_lock:
-            for deque_obj in self._history.values():
-                deque_obj.clear()
+        with self._history_lock:
+            for timestamps, values in self._history.values():
+                timestamps.clear()
+                values.clear()
 
     @property
     def statistics(self) -> dict:
@@ -3,6 +3,7 @@ Modbus RTU communication manager with multi-device support.
 """
 
 import struct
+import time
 from typing import Optional, Union, List, Dict
 import minimalmodbus
 import serial
@@ -97,7 +98,6 @@ class ModbusManager:
             self.instrument.address = slave_id
             self._current_slave_id = slave_id
             # Small delay after switching slave ID to allow RS485 bus to settle
-            import time
             time.sleep(0.01)  # 10ms
     
     def read_registers(self, slave_id: int, address: int, count: int) -> List[int]:
@@ -266,6 +266,59 @@ class ModbusManager:
         except Exception:
             return False
 
+    @staticmethod
+    def open_probe_instrument(
+        port: str,
+        baud_rate: int,
+        parity: str = "N",
+        stop_bits: int = 1,
+        timeout: float = 0.1,
+    ) -> minimalmodbus.Instrument:
+        """
+        Open an instrument for probing slave IDs on a port.
+        
+        The port stays open between probes; switch targets by setting
+        ``instrument.address`` and close ``instrument.serial`` when done.
+        
+        Args:
+            port: COM port
+            baud_rate: Serial baud rate
+            parity: Parity ('N', 'E', 'O')
+            stop_bits: Stop bits (1 or 2)
+            timeout: Read timeout in seconds
+            
+        Returns:
+            Configured instrument
+        """
+        instrument = minimalmodbus.Instrument(port, 1)
+        instrument.serial.baudrate = baud_rate
+        
+        parity_map = {
+            'N': serial.PARITY_NONE,
+            'E': serial.PARITY_EVEN,
+            'O': serial.PARITY_ODD,
+        }
+        instrument.serial.parity = parity_map.get(parity, serial.PARITY_NONE)
+        instrument.serial.stopbits = stop_bits
+        instrument.serial.timeout = timeout
+        instrument.close_port_after_each_call = False
+        return instrument
+    
+    @staticmethod
+    def probe_slave(instrument: minimalmodbus.Instrument, slave_id: int, register_address: int) -> bool:
+        """
+        Probe a single slave ID on an already open instrument.
+        
+        Returns:
+            True if device responded, False otherwise
+        """
+        instrument.address = slave_id
+        try:
+            instrument.read_register(register_address, 0)
+            return True
+        except Exception:
+            return False
+    
     @staticmethod
     def probe_device(
         port: str,
@@ -291,24 +344,14 @@ class ModbusManager:
         Returns:
             True if device responded, False otherwise
         """
+        instrument = None
         try:
-            instrument = minimalmodbus.Instrument(port, slave_id)
-            instrument.serial.baudrate = baud_rate
-            
-            parity_map = {
-                'N': serial.PARITY_NONE,
-                'E': serial.PARITY_EVEN,
-                'O': serial.PARITY_ODD,
-            }
-            instrument.serial.parity = parity_map.get(parity, serial.PARITY_NONE)
-            instrument.serial.stopbits = stop_bits
-            instrument.serial.timeout = timeout
-            
-            # Try reading the specified register
-            instrument.read_register(register_address, 0)
-            return True
+            instrument = ModbusManager.open_probe_instrument(
+                port, baud_rate, parity=parity, stop_bits=stop_bits, timeout=timeout
+            )
+            return ModbusManager.probe_slave(instrument, slave_id, register_address)
         except Exception:
             return False
         finally:
-            if 'instrument' in locals() and instrument.serial.is_open:
+            if instrument is not None and instrument.serial.is_open:
                 instrument.serial.close()
@@ -13,6 +13,19 @@ from src.models.variable import Variable
 from src.models.register import Register
 
 
+# Register reference patterns, compiled once
+FULL_REFERENCE_RE = re.compile(r'\bD(\d+)\.R(\d+)\b')  # D<id>.R<addr>
+LEGACY_REFERENCE_RE = re.compile(r'(?<!\.)(?<!D\d)\bR(\d+)\b')  # R<addr> without device
+LOCAL_REFERENCE_RE = re.compile(r'(?<!\.)\bR(\d+)\b')  # R<addr> to qualify with a device
+_PREPROCESSED_LEGACY_RE = re.compile(r'(?<!_D\d_)(?<!_D\d\d_)(?<!_D\d\d\d_)\bR(\d+)\b')
+_PREPROCESSED_VAR_RE = re.compile(r'_D(\d+)_R(\d+)')
+
+
+def localize_expression(expression: str, slave_id: int) -> str:
+    """Qualify bare register references with a device: R<addr> -> D<slave_id>.R<addr>."""
+    return LOCAL_REFERENCE_RE.sub(f'D{slave_id}.R\\1', expression)
+
+
 class VariableEvaluator:
     """
     Evaluates variable expressions using register values.
@@ -66,6 +79,8 @@ class VariableEvaluator:
     def __init__(self):
         self._registers: List[Register] = []
         self._register_map: Dict[Tuple[int, int], Register] = {}  # (slave_id, address) -> register
+        # expression -> (parsed AST body, [(variable name, (slave_id, address))])
+        self._cache: Dict[str, Tuple[ast.AST, List[Tuple[str, Tuple[int, int]]]]] = {}
     
     def set_registers(self, registers: List[Register]) -> None:
         """Set the available registers for expression evaluation."""
@@ -81,50 +96,41 @@ class VariableEvaluator:
         - R0, R100 (legacy) -> _D1_R0, _D1_R100
         """
         # First, replace D<id>.R<addr> references
-        full_pattern = r'\bD(\d+)\.R(\d+)\b'
-        result = re.sub(full_pattern, r'_D\1_R\2', expression)
+        result = FULL_REFERENCE_RE.sub(r'_D\1_R\2', expression)
         
         # Then, replace legacy R<addr> references (not already prefixed with D)
         # Match R<addr> that is NOT preceded by _D<digits>_ (already converted)
-        legacy_pattern = r'(?<!_D\d_)(?<!_D\d\d_)(?<!_D\d\d\d_)\bR(\d+)\b'
-        result = re.sub(legacy_pattern, r'_D1_R\1', result)
+        result = _PREPROCESSED_LEGACY_RE.sub(r'_D1_R\1', result)
         
         return result
     
-    def _get_variables(self, expression: str) -> Dict[str, float]:
-        """Get variable values for the expression."""
-        variables = {}
+    def _parse(self, expression: str) -> Tuple[ast.AST, List[Tuple[str, Tuple[int, int]]]]:
+        """
+        Parse an expression and collect its register references, caching the result.
         
-        # Find D<id>.R<addr> references
-        full_pattern = r'\bD(\d+)\.R(\d+)\b'
-        for match in re.finditer(full_pattern, expression):
-            slave_id = int(match.group(1))
-            address = int(match.group(2))
-            var_name = f"_D{slave_id}_R{address}"
-            if (slave_id, address) in self._register_map:
-                reg = self._register_map[(slave_id, address)]
-                if reg.scaled_value is not None:
-                    variables[var_name] = reg.scaled_value
-                else:
-                    variables[var_name] = 0.0
+        Raises:
+            SyntaxError: If the expression cannot be parsed
+        """
+        cached = self._cache.get(expression)
+        if cached is None:
+            refs = [
+                (f"_D{slave_id}_R{address}", (slave_id, address))
+                for slave_id, address in self.get_referenced_registers(expression)
+            ]
+            tree = ast.parse(self._preprocess_expression(expression), mode='eval')
+            cached = (tree.body, refs)
+            self._cache[expression] = cached
+        return cached
+    
+    def _get_variables(self, refs: List[Tuple[str, Tuple[int, int]]]) -> Dict[str, float]:
+        """Get variable values for the parsed register references."""
+        variables = {}
+        for var_name, key in refs:
+            reg = self._register_map.get(key)
+            if reg is not None and reg.scaled_value is not None:
+                variables[var_name] = reg.scaled_value
             else:
                 variables[var_name] = 0.0
-        
-        # Find legacy R<addr> references (default to slave_id=1)
-        legacy_pattern = r'(?<!\.)(?<!D\d)\bR(\d+)\b'
-        for match in re.finditer(legacy_pattern, expression):
-            address = int(match.group(1))
-            var_name = f"_D1_R{address}"
-            if var_name not in variables:
-                if (1, address) in self._register_map:
-                    reg = self._register_map[(1, address)]
-                    if reg.scaled_value is not None:
-                        variables[var_name] = reg.scaled_value
-                    else:
-                        variables[var_name] = 0.0
-                else:
-                    variables[var_name] = 0.0
-        
         return variables
     
     def evaluate(self, expression: str) -> float:
@@ -143,16 +149,10 @@ class VariableEvaluator:
         if not expression or not expression.strip():
             return 0.0
         
-        # Get variable values
-        variables = self._get_variables(expression)
-        
-        # Preprocess expression
-        processed = self._preprocess_expression(expression)
-        
-        # Parse and evaluate
+        # Parse (cached) and evaluate
         try:
-            tree = ast.parse(processed, mode='eval')
-            return self._eval_node(tree.body, variables)
+            body, refs = self._parse(expression)
+            return self._eval_node(body, self._get_variables(refs))
         except SyntaxError as e:
             raise ValueError(f"Invalid expression syntax: {e}")
         except ZeroDivisionError:
@@ -243,8 +243,7 @@ class VariableEvaluator:
             # Create dummy variables for validation
             variables = {}
             # Match both D<id>.R<addr> and legacy R<addr> patterns in preprocessed form
-            var_pattern = r'_D(\d+)_R(\d+)'
-            for match in re.finditer(var_pattern, processed):
+            for match in _PREPROCESSED_VAR_RE.finditer(processed):
                 variables[match.group(0)] = 1.0  # Use 1.0 instead of 0 to avoid division by zero in validation
             
             self._eval_node(tree.body, variables)
@@ -254,23 +253,18 @@ class VariableEvaluator:
     
     def get_referenced_registers(self, expression: str) -> List[Tuple[int, int]]:
         """Get list of (slave_id, address) tuples referenced in expression."""
-        refs = []
+        refs: Dict[Tuple[int, int], None] = {}  # Insertion-ordered set
         
         # Find D<id>.R<addr> references
-        full_pattern = r'\bD(\d+)\.R(\d+)\b'
-        for match in re.finditer(full_pattern, expression):
-            slave_id = int(match.group(1))
-            address = int(match.group(2))
-            ref = (slave_id, address)
-            if ref not in refs:
-                refs.append(ref)
+        for match in FULL_REFERENCE_RE.finditer(expression):
+            refs[(int(match.group(1)), int(match.group(2)))] = None
         
         # Find legacy R<addr> references
-        legacy_pattern = r'(?<!\.)(?<!D\d)\bR(\d+)\b'
-        for match in re.finditer(legacy_pattern, expression):
-            address = int(match.group(1))
-            ref = (1, address)  # Default to device 1
-            if ref not in refs:
-                refs.append(ref)
+        for match in LEGACY_REFERENCE_RE.finditer(expression):
+            refs[(1, int(match.group(1)))] = None  # Default to device 1
         
-        return refs
+        return list(refs)
+    
+    def clear_cache(self) -> None:
+        """Clear the parsed expression cache."""
+        self._cache.clear()
@@ -3,7 +3,7 @@ Project configuration model for saving/loading workspace state.
 """
 
 import json
-import base64
+import binascii
 from dataclasses import dataclass, field
 from typing import List, Optional
 from pathlib import Path
@@ -155,7 +155,7 @@ class Project:
         
         # Encode layout state as base64 if present
         if self.layout_state:
-            result["layout_state"] = base64.b64encode(self.layout_state).decode('utf-8')
+            result["layout_state"] = binascii.b2a_base64(self.layout_state, newline=False).decode('ascii')
         
         return result
     
@@ -173,7 +173,7 @@ class Project:
         # Decode layout state from base64 if present
         if "layout_state" in data:
             try:
-                project.layout_state = base64.b64decode(data["layout_state"])
+                project.layout_state = binascii.a2b_base64(data["layout_state"])
             except Exception:
                 project.layout_state = None
         
@@ -186,8 +186,11 @@ class Project:
             raise ValueError("No file path specified")
         
         self.file_path = path
+        # Encode fully before opening: one write instead of json.dump's many
+        # small ones, and a serialization error no longer truncates the file
+        text = json.dumps(self.to_dict(), indent=2)
         with open(path, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(), f, indent=2)
+            f.write(text)
     
     @classmethod
     def load(cls, file_path: str) -> "Project":
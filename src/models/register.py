@@ -24,6 +24,10 @@ class AccessMode(Enum):
     READ_WRITE = "read_write"
 
 
+# Access modes that allow writing to the device
+WRITABLE_ACCESS_MODES = frozenset((AccessMode.WRITE, AccessMode.READ_WRITE))
+
+
 @dataclass
 class Register:
     """Represents a Modbus register configuration."""
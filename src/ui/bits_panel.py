@@ -8,17 +8,28 @@ from typing import List, Dict, Optional, Tuple
 from PySide6.QtWidgets import (
     QFrame, QVBoxLayout, QHBoxLayout, QPushButton,
     QTableWidget, QTableWidgetItem, QHeaderView,
-    QAbstractItemView, QMessageBox, QLabel, QTabWidget, QWidget
+    QAbstractItemView, QMessageBox, QTabWidget, QWidget
 )
-from PySide6.QtCore import Qt, Signal, QSettings
-from PySide6.QtGui import QColor, QBrush
+from PySide6.QtCore import Qt, Signal, QSettings, QTimer
+from PySide6.QtGui import QColor, QBrush, QFont
 
 from src.models.bit import Bit
-from src.models.register import Register, AccessMode
+from src.models.register import Register, WRITABLE_ACCESS_MODES
 from src.ui.bit_editor import BitEditorDialog
 from src.ui.styles import COLORS
 
 
+# Value cell states: key -> (text, background, foreground, bold)
+_CELL_STATES = {
+    "true": ("TRUE", QBrush(QColor(COLORS['accent'])), QBrush(QColor("#ffffff")), True),
+    "false": ("FALSE", QBrush(QColor("#000000")), QBrush(QColor("#ffffff")), True),
+    "unknown": ("---", QBrush(), QBrush(QColor(COLORS['text_secondary'])), False),
+    "empty": ("", QBrush(), QBrush(), False),
+    "read_only": ("", QBrush(QColor(COLORS['bg_tertiary'])), QBrush(), False),
+}
+_CELL_STATE_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
 class BitsPanel(QFrame):
     """Panel for displaying and controlling individual register bits with device tabs."""
     
@@ -35,8 +46,21 @@ class BitsPanel(QFrame):
         self.slave_ids: List[int] = [1]
         self._live_bits: List[Bit] = []
         self._register_map: Dict[Tuple[int, int], Register] = {}  # (slave_id, addr) -> register
+        self._bit_sources: List[Tuple[Bit, Optional[Register]]] = []  # live bit -> source register
+        self._bits_by_register: Dict[Tuple[int, int], List[Bit]] = {}  # (slave_id, addr) -> live bits
         self._pending_bit_values: Dict[Tuple[int, str], bool] = {}  # (slave_id, bit_name) -> new_value
         self._device_tables: Dict[int, QTableWidget] = {}  # slave_id -> table
+        self._device_sources: Dict[int, List[Tuple[Bit, Optional[Register]]]] = {}  # slave_id -> (bit, register) in row order
+        
+        # Only the weight is set, the rest resolves against the table font
+        self._bold_font = QFont()
+        self._bold_font.setBold(True)
+        
+        # set_registers/set_bits/set_slave_ids usually arrive back to back; rebuild once
+        self._rebuild_timer = QTimer(self)
+        self._rebuild_timer.setSingleShot(True)
+        self._rebuild_timer.setInterval(0)
+        self._rebuild_timer.timeout.connect(self._rebuild_tabs)
         
         self._setup_ui()
         self._load_settings()
@@ -68,6 +92,7 @@ class BitsPanel(QFrame):
         
         # Tab widget for devices
         self.tab_widget = QTabWidget()
+        self.tab_widget.currentChanged.connect(self._update_display)
         layout.addWidget(self.tab_widget, stretch=1)
 
     def _create_table(self) -> QTableWidget:
@@ -101,77 +126,108 @@ class BitsPanel(QFrame):
         # Connect double-click for toggling
         table.cellDoubleClicked.connect(self._on_cell_double_clicked)
         
+        # Only visible rows are refreshed, so refresh whenever the visible range moves
+        table.verticalScrollBar().valueChanged.connect(self._update_display)
+        table.verticalScrollBar().rangeChanged.connect(self._update_display)
+        
         return table
 
     def _load_settings(self) -> None:
         """Load table settings."""
         settings = QSettings()
-        header_state = settings.value("bits_panel/header_state")
-        # Applied when tables are created
+        # Applied when tables are created; kept to skip no-op saves
+        self._stored_header_state = settings.value("bits_panel/header_state")
 
     def save_settings(self) -> None:
         """Save table settings."""
         settings = QSettings()
         if self._device_tables:
             first_table = next(iter(self._device_tables.values()))
-            settings.setValue("bits_panel/header_state", first_table.horizontalHeader().saveState())
+            header_state = first_table.horizontalHeader().saveState()
+            if header_state != self._stored_header_state:
+                settings.setValue("bits_panel/header_state", header_state)
+                self._stored_header_state = header_state
     
     def set_registers(self, registers: List[Register]) -> None:
         """Set the common register definitions."""
         self.register_definitions = registers
         # We also need live registers for the register map to show labels correctly
         # This will be updated when rebuild_tabs is called with live instances
-        self._rebuild_tabs()
+        self._schedule_rebuild()
     
     def set_bits(self, bits: List[Bit]) -> None:
         """Set the common bit definitions."""
         self.bit_definitions = bits
         self._pending_bit_values.clear()
-        self._rebuild_tabs()
+        self._schedule_rebuild()
     
     def set_slave_ids(self, slave_ids: List[int], live_registers: List[Register]) -> None:
         """Set connected slave IDs and live registers for value lookup."""
         self.slave_ids = slave_ids
         self._register_map = {(reg.slave_id, reg.address): reg for reg in live_registers}
-        self._rebuild_tabs()
+        self._schedule_rebuild()
     
     def get_bits(self) -> List[Bit]:
         """Get the common bit definitions."""
         return self.bit_definitions
     
+    def _schedule_rebuild(self) -> None:
+        """Rebuild tabs once control returns to the event loop."""
+        self._rebuild_timer.start()
+    
     def _rebuild_tabs(self) -> None:
         """Rebuild tabs for each device using common definitions."""
-        # Clear existing tabs
-        self.tab_widget.clear()
-        self._device_tables.clear()
-        self._live_bits = []
-        
-        # Create tab for each device
-        for slave_id in sorted(self.slave_ids):
-            # Create live bits for this device
-            device_bits = []
-            for bit_def in self.bit_definitions:
-                live_bit = bit_def.copy()
-                live_bit.slave_id = slave_id
-                device_bits.append(live_bit)
-                self._live_bits.append(live_bit)
-            
-            table = self._create_table()
-            self._device_tables[slave_id] = table
+        # A direct rebuild supersedes any scheduled one
+        self._rebuild_timer.stop()
+        # Suspend repaints while tabs are torn down and repopulated
+        self.tab_widget.setUpdatesEnabled(False)
+        try:
+            # Clear existing tabs (QTabWidget.clear() does not delete the pages)
+            for index in range(self.tab_widget.count()):
+                self.tab_widget.widget(index).deleteLater()
+            self.tab_widget.clear()
+            self._device_tables.clear()
+            self._device_sources.clear()
+            self._live_bits = []
+            self._bit_sources = []
+            self._bits_by_register = {}
             
-            table.blockSignals(True)
-            try:
-                self._populate_table(table, device_bits, slave_id)
-            finally:
-                table.blockSignals(False)
+            # Create tab for each device
+            for slave_id in sorted(self.slave_ids):
+                # Create live bits for this device
+                device_bits = []
+                device_sources = []
+                for bit_def in self.bit_definitions:
+                    live_bit = bit_def.copy()
+                    live_bit.slave_id = slave_id
+                    device_bits.append(live_bit)
+                    self._live_bits.append(live_bit)
+                    
+                    reg_key = (slave_id, live_bit.register_address)
+                    source = (live_bit, self._register_map.get(reg_key))
+                    device_sources.append(source)
+                    self._bit_sources.append(source)
+                    self._bits_by_register.setdefault(reg_key, []).append(live_bit)
+                
+                table = self._create_table()
+                self._device_tables[slave_id] = table
+                self._device_sources[slave_id] = device_sources
+                
+                table.blockSignals(True)
+                try:
+                    self._populate_table(table, device_bits, slave_id)
+                finally:
+                    table.blockSignals(False)
+                
+                self.tab_widget.addTab(table, f"Device {slave_id}")
             
-            self.tab_widget.addTab(table, f"Device {slave_id}")
-        
-        # If no devices, add empty tab
-        if not self.slave_ids:
-            table = self._create_table()
-            self._device_tables[0] = table
-            self.tab_widget.addTab(table, "No Devices")
+            # If no devices, add empty tab
+            if not self.slave_ids:
+                table = self._create_table()
+                self._device_tables[0] = table
+                self.tab_widget.addTab(table, "No Devices")
+        finally:
+            self.tab_widget.setUpdatesEnabled(True)
     
     def get_live_bits(self) -> List[Bit]:
         """Get all live bit instances across all devices."""
@@ -204,26 +260,14 @@ class BitsPanel(QFrame):
             bit_idx_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
             table.setItem(row, 2, bit_idx_item)
             
-            # Value (current) - Use QLabel for robust styling
-            value_label = QLabel("---")
-            value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            value_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
-            table.setCellWidget(row, 3, value_label)
-            
-            # New Value - Use QLabel for robust styling
-            new_value_label = QLabel("")
-            new_value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            new_value_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
-            new_value_label.setProperty("row", row)  # Store row index
-            
-            # Check if register is writable
-            is_writable = reg and reg.access_mode in (AccessMode.READ_WRITE, AccessMode.WRITE)
-            if not is_writable:
-                new_value_label.setStyleSheet(f"background-color: #eeeeee; border: none;")
-            else:
-                new_value_label.setStyleSheet("background-color: transparent; border: none;")
-            
-            table.setCellWidget(row, 4, new_value_label)
+            # Value (current) and New Value - painted from item roles
+            is_writable = reg and reg.access_mode in WRITABLE_ACCESS_MODES
+            for column, state in ((3, "unknown"), (4, "empty" if is_writable else "read_only")):
+                item = QTableWidgetItem()
+                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+                table.setItem(row, column, item)
+                self._set_cell_state(item, state)
         
         self._update_display()
     
@@ -252,7 +296,7 @@ class BitsPanel(QFrame):
         reg = self._register_map.get((bit.slave_id, bit.register_address))
         
         # Check if register is writable
-        if not reg or reg.access_mode not in (AccessMode.READ_WRITE, AccessMode.WRITE):
+        if not reg or reg.access_mode not in WRITABLE_ACCESS_MODES:
             QMessageBox.information(
                 self, "Read Only",
                 f"Register '{reg.label if reg else 'Unknown'}' is read-only."
@@ -282,81 +326,94 @@ class BitsPanel(QFrame):
         new_reg_value = int(current_reg_value)
         
         # Apply all bits for this register that have pending values
-        for b in self._live_bits:
-            if b.slave_id == reg.slave_id and b.register_address == reg.address:
-                b_key = (b.slave_id, b.name)
-                if b_key in self._pending_bit_values:
-                    new_reg_value = b.apply_to_value(new_reg_value, self._pending_bit_values[b_key])
+        for b in self._bits_by_register.get((reg.slave_id, reg.address), []):
+            b_key = (b.slave_id, b.name)
+            if b_key in self._pending_bit_values:
+                new_reg_value = b.apply_to_value(new_reg_value, self._pending_bit_values[b_key])
         
         self.bit_value_changed.emit(reg.slave_id, reg.address, new_reg_value)
         
         # Update display
         self._update_display()
     
+    def _visible_rows(self, table: QTableWidget) -> range:
+        """Get the range of rows currently inside the table viewport."""
+        row_count = table.rowCount()
+        if row_count == 0:
+            return range(0)
+        first = table.rowAt(0)
+        last = table.rowAt(table.viewport().height() - 1)
+        if first < 0:
+            first = 0
+        if last < 0:
+            last = row_count - 1
+        return range(first, last + 1)
+    
     def _update_display(self) -> None:
-        """Update the display of values."""
-        for slave_id, table in self._device_tables.items():
-            for row in range(table.rowCount()):
-                bit = self._get_bit_from_table(table, row)
-                if not bit:
-                    continue
-                
-                reg = self._register_map.get((bit.slave_id, bit.register_address))
-                
-                # Value (current)
-                value_label = table.cellWidget(row, 3)
-                if isinstance(value_label, QLabel):
-                    if bit.value is not None:
-                        if bit.value:
-                            value_label.setText("TRUE")
-                            value_label.setStyleSheet(
-                                "background-color: #1976d2; color: #ffffff; font-weight: bold; border: none;"
-                            )
-                        else:
-                            value_label.setText("FALSE")
-                            value_label.setStyleSheet(
-                                "background-color: #000000; color: #ffffff; font-weight: bold; border: none;"
-                            )
-                    else:
-                        value_label.setText("---")
-                        value_label.setStyleSheet("background-color: transparent; color: #757575; border: none;")
+        """Update the display of values on the visible rows of the current tab."""
+        table = self.tab_widget.currentWidget()
+        if not isinstance(table, QTableWidget):
+            return
+        
+        sources: List[Tuple[Bit, Optional[Register]]] = []
+        for slave_id, device_table in self._device_tables.items():
+            if device_table is table:
+                sources = self._device_sources.get(slave_id, [])
+                break
+        
+        for row in self._visible_rows(table):
+            if row >= len(sources):
+                break
+            bit, reg = sources[row]
+            
+            # Value (current)
+            value_item = table.item(row, 3)
+            if value_item:
+                if bit.value is not None:
+                    self._set_cell_state(value_item, "true" if bit.value else "false")
+                else:
+                    self._set_cell_state(value_item, "unknown")
+            
+            # New Value
+            new_value_item = table.item(row, 4)
+            if new_value_item:
+                is_writable = reg and reg.access_mode in WRITABLE_ACCESS_MODES
                 
-                # New Value
-                new_value_label = table.cellWidget(row, 4)
-                if isinstance(new_value_label, QLabel):
-                    is_writable = reg and reg.access_mode in (AccessMode.READ_WRITE, AccessMode.WRITE)
-                    
-                    if is_writable:
-                        key = (bit.slave_id, bit.name)
-                        if key in self._pending_bit_values:
-                            pending_value = self._pending_bit_values[key]
-                            if pending_value:
-                                new_value_label.setText("TRUE")
-                                new_value_label.setStyleSheet(
-                                    "background-color: #1976d2; color: #ffffff; font-weight: bold; border: none;"
-                                )
-                            else:
-                                new_value_label.setText("FALSE")
-                                new_value_label.setStyleSheet(
-                                    "background-color: #000000; color: #ffffff; font-weight: bold; border: none;"
-                                )
-                        else:
-                            new_value_label.setText("")
-                            new_value_label.setStyleSheet("background-color: transparent; border: none;")
+                if is_writable:
+                    key = (bit.slave_id, bit.name)
+                    if key in self._pending_bit_values:
+                        self._set_cell_state(new_value_item, "true" if self._pending_bit_values[key] else "false")
                     else:
-                        new_value_label.setText("")
-                        new_value_label.setStyleSheet("background-color: #eeeeee; border: none;")
+                        self._set_cell_state(new_value_item, "empty")
+                else:
+                    self._set_cell_state(new_value_item, "read_only")
+    
+    def _set_cell_state(self, item: QTableWidgetItem, state: str) -> None:
+        """Apply a value cell state, skipping items already in that state."""
+        if item.data(_CELL_STATE_ROLE) == state:
+            return
+        text, background, foreground, bold = _CELL_STATES[state]
+        item.setData(_CELL_STATE_ROLE, state)
+        item.setText(text)
+        item.setBackground(background)
+        item.setForeground(foreground)
+        item.setData(Qt.ItemDataRole.FontRole, self._bold_font if bold else None)
     
     def update_values(self) -> None:
         """Update bit values from registers."""
-        for bit in self._live_bits:
-            reg = self._register_map.get((bit.slave_id, bit.register_address))
+        changed = False
+        for bit, reg in self._bit_sources:
             if reg and reg.raw_value is not None:
-                bit.value = bit.extract_from_value(int(reg.raw_value))
+                value = bit.extract_from_value(int(reg.raw_value))
             else:
-                bit.value = None
-        
-        self._update_display()
+                value = None
+            if value != bit.value:
+                bit.value = value
+                changed = True
+        
+        # Idle devices usually return the same values, nothing to repaint then
+        if changed:
+            self._update_display()
     
     def clear_pending(self, slave_id: Optional[int] = None, register_address: Optional[int] = None) -> None:
         """Clear pending bit values."""
@@ -364,9 +421,8 @@ class BitsPanel(QFrame):
             self._pending_bit_values.clear()
         else:
             # Only clear bits for this register
-            for bit in self._live_bits:
-                if bit.slave_id == slave_id and bit.register_address == register_address:
-                    self._pending_bit_values.pop((bit.slave_id, bit.name), None)
+            for bit in self._bits_by_register.get((slave_id, register_address), []):
+                self._pending_bit_values.pop((bit.slave_id, bit.name), None)
         self._update_display()
     
     def _add_bit(self) -> None:
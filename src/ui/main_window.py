@@ -3,6 +3,7 @@ Main application window with multi-device support.
 """
 
 import os
+from typing import Dict, List, Optional
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QToolBar, QStatusBar, QMenuBar, QMenu, QDockWidget,
@@ -10,23 +11,83 @@ from PySide6.QtWidgets import (
     QComboBox, QSpinBox, QToolButton, QWidgetAction,
     QFormLayout
 )
-from PySide6.QtCore import Qt, QSettings, QTimer, QByteArray, Signal
-from PySide6.QtGui import QAction, QKeySequence, QIcon
+from PySide6.QtCore import Qt, QSettings, QTimer, QByteArray, Signal, QThread
+from PySide6.QtGui import QAction, QKeySequence, QIcon, QPixmap, QPainter, QColor, QImageReader
 
 from src.models.project import Project, ConnectionSettings
 from src.core.modbus_manager import ModbusManager
 from src.core.data_engine import DataEngine
-from src.utils.serial_ports import get_available_ports
+from src.utils.serial_ports import (
+    get_available_ports, invalidate_ports_cache, PORT_CACHE_SECONDS, BAUD_RATES, PARITY_CODES, PARITY_LABELS, STOP_BITS
+)
 from src.ui.table_view import TableView
 from src.ui.plot_view import PlotView
 from src.ui.variables_panel import VariablesPanel
 from src.ui.bits_panel import BitsPanel
 from src.ui.speed_test_panel import SpeedTestPanel
-from src.ui.register_editor import RegisterEditorDialog
-from src.ui.scan_dialog import ScanDialog
 from src.ui.styles import COLORS
 
 
+# Application root (two levels above src/ui)
+APP_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+
+def _find_asset(*names: str) -> str:
+    """Return the first existing asset path, checking assets/ before the app root."""
+    for directory in (os.path.join(APP_DIR, "assets"), APP_DIR):
+        for name in names:
+            path = os.path.join(directory, name)
+            if os.path.exists(path):
+                return path
+    return ""
+
+
+# Resolved once at import instead of probing the filesystem per use
+WINDOW_ICON_PATH = _find_asset("icon.ico", "icon.png")
+ABOUT_ICON_PATH = _find_asset("icon.png")
+
+# Status bar refresh periods while polling / while connected but idle
+STATUS_INTERVAL_POLLING_MS = 500
+STATUS_INTERVAL_IDLE_MS = 2000
+
+# Connection label styles
+CONNECTED_STYLE = f"color: {COLORS['success']}; font-weight: 500;"
+DISCONNECTED_STYLE = f"color: {COLORS['error']}; font-weight: 500;"
+DISCONNECTED_TEXT = "Disconnected"
+STATUS_DOT_SIZE = 10
+ABOUT_ICON_SIZE = 64
+
+
+def _make_status_dot(color: str) -> QPixmap:
+    """Render a filled status indicator circle."""
+    pixmap = QPixmap(STATUS_DOT_SIZE, STATUS_DOT_SIZE)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QColor(color))
+    painter.drawEllipse(0, 0, STATUS_DOT_SIZE, STATUS_DOT_SIZE)
+    painter.end()
+    return pixmap
+
+
+class PortScanWorker(QThread):
+    """Worker thread for enumerating serial ports off the GUI thread."""
+    
+    ports_ready = Signal(list)  # List of (port_name, description)
+    
+    def __init__(self, max_age: float):
+        super().__init__()
+        self.max_age = max_age
+    
+    def run(self):
+        try:
+            ports = get_available_ports(max_age=self.max_age)
+        except Exception:
+            ports = []
+        self.ports_ready.emit(ports)
+
+
 class MainWindow(QMainWindow):
     """Main application window with dockable panels and multi-device support."""
     
@@ -42,6 +103,31 @@ class MainWindow(QMainWindow):
         # Track found devices from scan
         self._found_devices: list = []
         self._connected_slave_ids: list = []
+        self._last_synced: tuple = ()  # (registers, variables, slave_ids) last pushed to panels
+        self._device_menu_key: tuple = ()  # (found, selected) device IDs the menu currently shows
+        
+        # Background port enumeration
+        self._port_worker: Optional[PortScanWorker] = None
+        self._requested_port = ""  # Port to select once the port list arrives
+        self._ports_pending = False  # A refresh is running or its result is still queued
+        self._forced_refresh_queued = False  # Forced refresh asked for while one was pending
+        self._port_list: List[tuple] = []  # Last enumerated (port, description) pairs
+        self._port_index: Dict[str, int] = {}  # Port name -> combo index
+        
+        # Last status bar texts/style set, so unchanged values don't touch the widgets
+        self._poll_status: tuple = ()
+        self._connection_state: Optional[bool] = None
+        self._about_pixmap: Optional[QPixmap] = None
+        
+        # Layout blobs currently held in QSettings (set by _load_settings)
+        self._stored_geometry: Optional[QByteArray] = None
+        self._stored_state: Optional[QByteArray] = None
+        
+        # Engine updates queued while the GUI was busy collapse into one panel refresh
+        self._data_refresh_timer = QTimer(self)
+        self._data_refresh_timer.setSingleShot(True)
+        self._data_refresh_timer.setInterval(0)
+        self._data_refresh_timer.timeout.connect(self._on_data_updated)
         
         # Setup UI
         self.setWindowTitle("Modbus Viewer")
@@ -64,33 +150,31 @@ class MainWindow(QMainWindow):
         self._setup_dock_widgets()
         self._setup_connections()
         
+        # Status update timer, only runs while connected (see _connect/_disconnect)
+        self._status_timer = QTimer(self)
+        self._status_timer.setInterval(STATUS_INTERVAL_POLLING_MS)
+        self._status_timer.timeout.connect(self._update_status)
+        self._update_status()
+        
         # Restore window state
         self._load_settings()
         
         # Refresh ports initially
         self._refresh_ports()
         
-        # Load initial project if specified
+        # Load initial project if specified, once the window has had a chance to paint.
+        # This may run before the port list is delivered; _select_port then keeps the
+        # project's port and _on_ports_ready applies it.
         if initial_project_path:
-            self._load_project_from_path(initial_project_path)
-        
-        # Status update timer
-        self._status_timer = QTimer(self)
-        self._status_timer.timeout.connect(self._update_status)
-        self._status_timer.start(500)
+            QTimer.singleShot(0, lambda: self._load_project_from_path(initial_project_path))
     
     def _set_window_icon(self) -> None:
         """Set window icon from assets."""
-        icon_paths = [
-            os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "assets", "icon.ico"),
-            os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "assets", "icon.png"),
-            os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "icon.ico"),
-            os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "icon.png"),
-        ]
-        for path in icon_paths:
-            if os.path.exists(path):
-                self.setWindowIcon(QIcon(path))
-                break
+        if WINDOW_ICON_PATH:
+            # main.py already loaded this file as the application icon; share it
+            # (QIcon is implicitly shared) instead of decoding the file again
+            app_icon = QApplication.windowIcon()
+            self.setWindowIcon(app_icon if not app_icon.isNull() else QIcon(WINDOW_ICON_PATH))
 
     def _setup_menu(self) -> None:
         """Setup menu bar."""
@@ -162,7 +246,7 @@ class MainWindow(QMainWindow):
         
         self.refresh_ports_action = QAction("↻", self)
         self.refresh_ports_action.setToolTip("Refresh COM ports")
-        self.refresh_ports_action.triggered.connect(self._refresh_ports)
+        self.refresh_ports_action.triggered.connect(self._on_refresh_ports_triggered)
         toolbar.addAction(self.refresh_ports_action)
         
         self.scan_action = QAction("Scan", self)
@@ -181,7 +265,6 @@ class MainWindow(QMainWindow):
         self.device_btn.setToolTip("Select devices to connect to (multi-select)")
         
         self.device_menu = QMenu(self)
-        self.device_menu.aboutToHide.connect(self._on_device_menu_about_to_hide)
         self.device_btn.setMenu(self.device_menu)
         toolbar.addWidget(self.device_btn)
         
@@ -201,7 +284,7 @@ class MainWindow(QMainWindow):
         baud_layout.setContentsMargins(10, 5, 10, 5)
         baud_layout.addWidget(QLabel("Baud Rate:"))
         self.baud_combo = QComboBox()
-        self.baud_combo.addItems(["9600", "19200", "38400", "57600", "115200", "230400", "460800"])
+        self.baud_combo.addItems(list(BAUD_RATES))
         self.baud_combo.setCurrentText("9600")
         baud_layout.addWidget(self.baud_combo)
         
@@ -215,7 +298,7 @@ class MainWindow(QMainWindow):
         parity_layout.setContentsMargins(10, 5, 10, 5)
         parity_layout.addWidget(QLabel("Parity:"))
         self.parity_combo = QComboBox()
-        self.parity_combo.addItems(["None", "Even", "Odd"])
+        self.parity_combo.addItems(list(PARITY_CODES))
         parity_layout.addWidget(self.parity_combo)
         
         parity_action = QWidgetAction(self)
@@ -228,7 +311,7 @@ class MainWindow(QMainWindow):
         stop_layout.setContentsMargins(10, 5, 10, 5)
         stop_layout.addWidget(QLabel("Stop Bits:"))
         self.stopbits_combo = QComboBox()
-        self.stopbits_combo.addItems(["1", "2"])
+        self.stopbits_combo.addItems(list(STOP_BITS))
         stop_layout.addWidget(self.stopbits_combo)
         
         stop_action = QWidgetAction(self)
@@ -278,57 +361,129 @@ class MainWindow(QMainWindow):
         self.connect_action.triggered.connect(self._toggle_connection)
         toolbar.addAction(self.connect_action)
 
-    def _refresh_ports(self) -> None:
-        """Refresh available COM ports."""
-        current = self.port_combo.currentData()
+    def _on_refresh_ports_triggered(self) -> None:
+        """Re-enumerate COM ports when the user explicitly asks for it."""
+        self._refresh_ports(force=True)
+    
+    def _refresh_ports(self, force: bool = False) -> None:
+        """Refresh available COM ports (force bypasses the short enumeration cache)."""
+        if self._ports_pending:
+            # An enumeration is already on its way; a forced one runs after it
+            # since the pending one may be serving the cache
+            if force:
+                self._forced_refresh_queued = True
+            return
+        
+        # The previous worker has delivered its list but may not have returned
+        # from run() yet; never drop the last reference to a running QThread
+        if self._port_worker is not None:
+            self._port_worker.wait()
+            self._port_worker.deleteLater()
+        
+        # Cleared when ports_ready is delivered, not when the thread finishes:
+        # the queued signal can still be pending after the thread has exited
+        self._ports_pending = True
+        self._port_worker = PortScanWorker(max_age=0 if force else PORT_CACHE_SECONDS)
+        self._port_worker.ports_ready.connect(self._on_ports_ready)
+        self._port_worker.start()
+    
+    def _on_ports_ready(self, ports: list) -> None:
+        """Populate the port combo from a finished enumeration."""
+        self._ports_pending = False
+        if self._forced_refresh_queued:
+            self._forced_refresh_queued = False
+            self._refresh_ports(force=True)
+        requested = self._requested_port
+        self._requested_port = ""
+        
+        # Same ports as last time: keep the combo, only apply a pending selection
+        if ports == self._port_list:
+            index = self._port_index.get(requested, -1)
+            if index >= 0:
+                self.port_combo.setCurrentIndex(index)
+            return
+        
+        current = requested or self.port_combo.currentData()
+        self._port_list = ports
+        self._port_index = {port: i for i, (port, _) in enumerate(ports)}
+        
+        # Repopulate silently; intermediate index changes are meaningless
+        self.port_combo.blockSignals(True)
         self.port_combo.clear()
         
-        ports = get_available_ports()
         for port, description in ports:
             self.port_combo.addItem(f"{port} - {description}", port)
         
         # Restore selection if still available
         if current:
-            index = self.port_combo.findData(current)
+            index = self._port_index.get(current, -1)
             if index >= 0:
                 self.port_combo.setCurrentIndex(index)
+        self.port_combo.blockSignals(False)
+    
+    def _select_port(self, port: str) -> None:
+        """Select a port, or remember it until the port list has been loaded."""
+        index = self._port_index.get(port, -1)
+        if index >= 0:
+            self.port_combo.setCurrentIndex(index)
+            self._requested_port = ""
+        else:
+            # Not listed (yet): the next delivered port list applies it if present
+            self._requested_port = port
 
     def _update_device_menu(self) -> None:
         """Update the device selection menu with found devices."""
-        self.device_menu.clear()
-        
-        if not self._found_devices:
-            self.device_btn.setText("Run Scan")
-            no_devices_action = QAction("No devices found - run scan first", self)
-            no_devices_action.setEnabled(False)
-            self.device_menu.addAction(no_devices_action)
+        # An unchanged device set (e.g. on connect) needs no rebuild
+        key = self._device_menu_state()
+        if key == self._device_menu_key:
+            self._update_device_btn_text()
             return
+        self._device_menu_key = key
         
-        # Add select all / deselect all actions
-        select_all_action = QAction("Select All", self)
-        select_all_action.triggered.connect(self._select_all_devices)
-        self.device_menu.addAction(select_all_action)
-        
-        deselect_all_action = QAction("Deselect All", self)
-        deselect_all_action.triggered.connect(self._deselect_all_devices)
-        self.device_menu.addAction(deselect_all_action)
-        
-        self.device_menu.addSeparator()
-        
-        # Add checkable action for each device
-        for slave_id in sorted(self._found_devices):
-            action = QAction(f"Device {slave_id}", self)
-            action.setCheckable(True)
-            action.setChecked(slave_id in self._connected_slave_ids)
-            action.setData(slave_id)
-            action.triggered.connect(lambda checked, sid=slave_id: self._on_device_toggled(sid, checked))
-            self.device_menu.addAction(action)
+        # Rebuild without intermediate relayouts; QMenu.clear() deletes actions it parents
+        self.device_menu.setUpdatesEnabled(False)
+        try:
+            self.device_menu.clear()
+            
+            if not self._found_devices:
+                self.device_btn.setText("Run Scan")
+                no_devices_action = QAction("No devices found - run scan first", self.device_menu)
+                no_devices_action.setEnabled(False)
+                self.device_menu.addAction(no_devices_action)
+                return
+            
+            # Add select all / deselect all actions
+            select_all_action = QAction("Select All", self.device_menu)
+            select_all_action.triggered.connect(self._select_all_devices)
+            self.device_menu.addAction(select_all_action)
+            
+            deselect_all_action = QAction("Deselect All", self.device_menu)
+            deselect_all_action.triggered.connect(self._deselect_all_devices)
+            self.device_menu.addAction(deselect_all_action)
+            
+            self.device_menu.addSeparator()
+            
+            # Add checkable action for each device
+            connected = set(self._connected_slave_ids)
+            for slave_id in sorted(self._found_devices):
+                action = QAction(f"Device {slave_id}", self.device_menu)
+                action.setCheckable(True)
+                action.setChecked(slave_id in connected)
+                action.setData(slave_id)
+                action.triggered.connect(self._on_device_toggled)
+                self.device_menu.addAction(action)
+        finally:
+            self.device_menu.setUpdatesEnabled(True)
         
         self._update_device_btn_text()
     
+    def _device_menu_state(self) -> tuple:
+        """Return the (found, selected) device IDs as a comparable key."""
+        return (tuple(sorted(self._found_devices)), tuple(sorted(self._connected_slave_ids)))
+    
     def _update_device_btn_text(self) -> None:
         """Update the device button text based on selection."""
-        selected = self._get_selected_slave_ids()
+        selected = self._connected_slave_ids
         if not selected:
             if self._found_devices:
                 self.device_btn.setText("Select Devices")
@@ -339,18 +494,12 @@ class MainWindow(QMainWindow):
         else:
             self.device_btn.setText(f"{len(selected)} Devices")
     
-    def _get_selected_slave_ids(self) -> list:
-        """Get the list of selected slave IDs from the menu."""
-        selected = []
-        for action in self.device_menu.actions():
-            if action.isCheckable() and action.isChecked():
-                slave_id = action.data()
-                if slave_id is not None:
-                    selected.append(slave_id)
-        return sorted(selected)
-    
-    def _on_device_toggled(self, slave_id: int, checked: bool) -> None:
-        """Handle device selection toggle."""
+    def _on_device_toggled(self, checked: bool) -> None:
+        """Handle device selection toggle (slave ID is stored on the sending action)."""
+        action = self.sender()
+        if not isinstance(action, QAction):
+            return
+        slave_id = action.data()
         if checked:
             if slave_id not in self._connected_slave_ids:
                 self._connected_slave_ids.append(slave_id)
@@ -358,14 +507,18 @@ class MainWindow(QMainWindow):
             if slave_id in self._connected_slave_ids:
                 self._connected_slave_ids.remove(slave_id)
         self._connected_slave_ids.sort()
+        # The check marks were changed in place; the menu now shows this state
+        self._device_menu_key = self._device_menu_state()
         self._update_device_btn_text()
     
     def _select_all_devices(self) -> None:
         """Select all devices."""
-        self._connected_slave_ids = self._found_devices.copy()
+        self._connected_slave_ids = sorted(self._found_devices)
         for action in self.device_menu.actions():
             if action.isCheckable():
                 action.setChecked(True)
+        # The check marks were changed in place; the menu now shows this state
+        self._device_menu_key = self._device_menu_state()
         self._update_device_btn_text()
     
     def _deselect_all_devices(self) -> None:
@@ -374,20 +527,22 @@ class MainWindow(QMainWindow):
         for action in self.device_menu.actions():
             if action.isCheckable():
                 action.setChecked(False)
+        # The check marks were changed in place; the menu now shows this state
+        self._device_menu_key = self._device_menu_state()
         self._update_device_btn_text()
-    
-    def _on_device_menu_about_to_hide(self) -> None:
-        """Called when device menu is about to hide - sync selected devices."""
-        self._connected_slave_ids = self._get_selected_slave_ids()
 
     def _setup_status_bar(self) -> None:
         """Setup status bar."""
         self.statusbar = QStatusBar()
         self.setStatusBar(self.statusbar)
         
-        # Connection status
-        self.connection_label = QLabel("🔴 Disconnected")
-        self.connection_label.setStyleSheet(f"color: {COLORS['error']}; font-weight: 500;")
+        # Connection status: pre-rendered dot + plain text label
+        self._dot_connected = _make_status_dot(COLORS['success'])
+        self._dot_disconnected = _make_status_dot(COLORS['error'])
+        self.connection_icon = QLabel()
+        self.statusbar.addWidget(self.connection_icon)
+        self.connection_label = QLabel()
+        self._set_connection_status(False, DISCONNECTED_TEXT)
         self.statusbar.addWidget(self.connection_label)
         
         # Spacer
@@ -406,6 +561,11 @@ class MainWindow(QMainWindow):
         # Register count
         self.register_label = QLabel("Registers: 0")
         self.statusbar.addPermanentWidget(self.register_label)
+        
+        # Status texts are never HTML; skip Qt's rich-text detection on every setText
+        for label in (self.connection_label, self.poll_label,
+                      self.poll_duration_label, self.register_label):
+            label.setTextFormat(Qt.TextFormat.PlainText)
     
     def _setup_dock_widgets(self) -> None:
         """Setup dockable panels."""
@@ -484,12 +644,18 @@ class MainWindow(QMainWindow):
         # Stack plot below registers/variables
         self.splitDockWidget(self.registers_dock, self.plot_dock, Qt.Orientation.Vertical)
         
+        # All docks in view menu order
+        self._docks: List[QDockWidget] = [
+            self.registers_dock,
+            self.variables_dock,
+            self.bits_dock,
+            self.speed_test_dock,
+            self.plot_dock,
+        ]
+        
         # Add all docks to view menu
-        self._view_menu.addAction(self.registers_dock.toggleViewAction())
-        self._view_menu.addAction(self.variables_dock.toggleViewAction())
-        self._view_menu.addAction(self.bits_dock.toggleViewAction())
-        self._view_menu.addAction(self.speed_test_dock.toggleViewAction())
-        self._view_menu.addAction(self.plot_dock.toggleViewAction())
+        for dock in self._docks:
+            self._view_menu.addAction(dock.toggleViewAction())
         
         self._view_menu.addSeparator()
         
@@ -500,36 +666,32 @@ class MainWindow(QMainWindow):
     
     def _reset_layout(self) -> None:
         """Reset dock layout to default."""
-        # Show all docks
-        self.registers_dock.show()
-        self.variables_dock.show()
-        self.bits_dock.show()
-        self.speed_test_dock.show()
-        self.plot_dock.show()
-        
-        # Float none
-        self.registers_dock.setFloating(False)
-        self.variables_dock.setFloating(False)
-        self.bits_dock.setFloating(False)
-        self.speed_test_dock.setFloating(False)
-        self.plot_dock.setFloating(False)
-        
-        # Reset positions
-        self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.registers_dock)
-        self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.variables_dock)
-        self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.bits_dock)
-        self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.speed_test_dock)
-        self.tabifyDockWidget(self.registers_dock, self.variables_dock)
-        self.tabifyDockWidget(self.variables_dock, self.bits_dock)
-        self.tabifyDockWidget(self.bits_dock, self.speed_test_dock)
-        self.registers_dock.raise_()
-        self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.plot_dock)
-        self.splitDockWidget(self.registers_dock, self.plot_dock, Qt.Orientation.Vertical)
+        # Repaint once at the end instead of after every dock move
+        self.setUpdatesEnabled(False)
+        try:
+            # Show all docks, float none
+            for dock in self._docks:
+                dock.show()
+                dock.setFloating(False)
+            
+            # Reset positions
+            self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.registers_dock)
+            self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.variables_dock)
+            self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.bits_dock)
+            self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.speed_test_dock)
+            self.tabifyDockWidget(self.registers_dock, self.variables_dock)
+            self.tabifyDockWidget(self.variables_dock, self.bits_dock)
+            self.tabifyDockWidget(self.bits_dock, self.speed_test_dock)
+            self.registers_dock.raise_()
+            self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.plot_dock)
+            self.splitDockWidget(self.registers_dock, self.plot_dock, Qt.Orientation.Vertical)
+        finally:
+            self.setUpdatesEnabled(True)
     
     def _setup_connections(self) -> None:
         """Setup signal connections."""
         # Data engine
-        self.data_engine.data_updated.connect(self._on_data_updated)
+        self.data_engine.data_updated.connect(self._schedule_data_refresh)
         self.data_engine.error_occurred.connect(self._on_error)
         self.data_engine.connection_lost.connect(self._on_connection_lost)
         
@@ -546,6 +708,10 @@ class MainWindow(QMainWindow):
         
         # Plot view
         self.plot_view.maximize_requested.connect(self._on_plot_maximize_requested)
+        
+        # Docks skip updates while hidden, so catch up when shown
+        for dock in self._docks:
+            dock.visibilityChanged.connect(self._on_dock_visibility_changed)
     
     def _on_plot_maximize_requested(self) -> None:
         """Maximize plot as independent window."""
@@ -565,12 +731,22 @@ class MainWindow(QMainWindow):
         state = settings.value("windowState")
         if state:
             self.restoreState(state)
+        
+        # Remember what is stored so an untouched layout isn't written back on close
+        self._stored_geometry = geometry
+        self._stored_state = state
     
     def _save_settings(self) -> None:
         """Save window settings."""
         settings = QSettings()
-        settings.setValue("geometry", self.saveGeometry())
-        settings.setValue("windowState", self.saveState())
+        state = self.saveState()
+        geometry = self.saveGeometry()
+        if geometry != self._stored_geometry:
+            settings.setValue("geometry", geometry)
+            self._stored_geometry = geometry
+        if state != self._stored_state:
+            settings.setValue("windowState", state)
+            self._stored_state = state
         
         # Save table view settings
         self.table_view.save_settings()
@@ -578,13 +754,15 @@ class MainWindow(QMainWindow):
         self.bits_panel.save_settings()
         
         # Also save layout state to project (convert QByteArray to bytes)
-        self.project.layout_state = bytes(self.saveState().data())
+        self.project.layout_state = bytes(state.data())
     
     def closeEvent(self, event) -> None:
         """Handle window close."""
         self._save_settings()
         self.data_engine.stop()
         self.modbus.disconnect()
+        if self._port_worker is not None:
+            self._port_worker.wait()
         event.accept()
     
     # Actions
@@ -670,6 +848,9 @@ class MainWindow(QMainWindow):
     
     def _edit_registers(self) -> None:
         """Open register editor dialog."""
+        # Dialogs are imported on first use; neither is needed to show the main window
+        from src.ui.register_editor import RegisterEditorDialog
+        
         dialog = RegisterEditorDialog(self.project.registers, self)
         if dialog.exec():
             self.project.registers = dialog.get_registers()
@@ -680,28 +861,39 @@ class MainWindow(QMainWindow):
         """Sync registers to all components by creating live instances per device."""
         slave_ids = self._connected_slave_ids if self._connected_slave_ids else [1]
         
-        # 1. Update Table View and Bits Panel definitions first
-        self.table_view.set_registers(self.project.registers)
-        self.table_view.set_slave_ids(slave_ids)
-        
-        self.bits_panel.set_registers(self.project.registers)
-        
-        # 2. Get live instances that were just created
-        live_registers = self.table_view.get_live_registers()
-        
-        # 3. Propagate live instances to other components
-        self.data_engine.set_registers(live_registers)
-        self.plot_view.set_registers(live_registers)
-        
-        # Variables panel needs definitions and slave IDs
-        self.variables_panel.set_registers(live_registers)
-        self.variables_panel.set_variables(self.project.variables)
-        self.variables_panel.set_slave_ids(slave_ids)
-        
-        # Bits panel needs live registers for value lookup
-        self.bits_panel.set_slave_ids(slave_ids, live_registers)
+        # Definition lists are replaced (never mutated) on edit/load, so identity
+        # plus the device set tells whether the panels already hold this state
+        synced = (self.project.registers, self.project.variables, tuple(slave_ids))
+        last = self._last_synced
+        if last and last[0] is synced[0] and last[1] is synced[1] and last[2] == synced[2]:
+            return
+        self._last_synced = synced
         
-        self.speed_test_panel.set_registers(live_registers)
+        # Every panel rebuilds its widgets here; repaint once at the end
+        self.setUpdatesEnabled(False)
+        try:
+            # 1. Update Table View and Bits Panel definitions first
+            self.table_view.set_registers(self.project.registers, slave_ids)
+            
+            self.bits_panel.set_registers(self.project.registers)
+            
+            # 2. Get live instances that were just created
+            live_registers = self.table_view.get_live_registers()
+            
+            # 3. Propagate live instances to other components
+            self.data_engine.set_registers(live_registers)
+            self.plot_view.set_registers(live_registers)
+            
+            # Variables panel needs definitions and slave IDs
+            self.variables_panel.set_registers(live_registers)
+            self.variables_panel.set_variables(self.project.variables, slave_ids)
+            
+            # Bits panel needs live registers for value lookup
+            self.bits_panel.set_slave_ids(slave_ids, live_registers)
+            
+            self.speed_test_panel.set_registers(live_registers)
+        finally:
+            self.setUpdatesEnabled(True)
     
     def _sync_variables(self) -> None:
         """Sync variables to all components using live instances from panel."""
@@ -722,17 +914,14 @@ class MainWindow(QMainWindow):
     
     def _get_connection_settings(self) -> ConnectionSettings:
         """Get current connection settings from toolbar."""
-        parity_map = {"None": "N", "Even": "E", "Odd": "O"}
-        
-        # Get selected slave IDs from menu (sync first)
-        self._connected_slave_ids = self._get_selected_slave_ids()
-        slave_ids = self._connected_slave_ids if self._connected_slave_ids else []
+        # Selection is kept current by the device menu handlers
+        slave_ids = sorted(self._connected_slave_ids)
         
         return ConnectionSettings(
             port=self.port_combo.currentData() or "",
             slave_ids=slave_ids,
             baud_rate=int(self.baud_combo.currentText()),
-            parity=parity_map.get(self.parity_combo.currentText(), "N"),
+            parity=PARITY_CODES.get(self.parity_combo.currentText(), "N"),
             stop_bits=int(self.stopbits_combo.currentText()),
             timeout=self.timeout_spin.value() / 1000.0,
             found_devices=self._found_devices.copy(),
@@ -764,8 +953,7 @@ class MainWindow(QMainWindow):
             
             self.project.connection = settings
             device_str = ", ".join(str(s) for s in settings.slave_ids)
-            self.connection_label.setText(f"🟢 Connected: {settings.port} (D{device_str})")
-            self.connection_label.setStyleSheet(f"color: {COLORS['success']}; font-weight: 500;")
+            self._set_connection_status(True, f"Connected: {settings.port} (D{device_str})")
             self.speed_test_panel.set_connected(True)
             self.connect_action.setText("Disconnect")
             
@@ -779,18 +967,24 @@ class MainWindow(QMainWindow):
             self._sync_registers()
             self._sync_variables()
             self.data_engine.start()
+            self._status_timer.start()
+            self._update_status()
             
         except Exception as e:
             QMessageBox.critical(self, "Connection Error", str(e))
             self.connect_action.setChecked(False)
+            # The port may have gone away; don't keep offering a stale list
+            invalidate_ports_cache()
+            self._refresh_ports()
     
     def _disconnect(self) -> None:
         """Disconnect from Modbus devices."""
         self.data_engine.stop()
         self.modbus.disconnect()
+        self._status_timer.stop()
+        self._update_status()
         # Keep the device selection so user can easily reconnect
-        self.connection_label.setText("🔴 Disconnected")
-        self.connection_label.setStyleSheet(f"color: {COLORS['error']}; font-weight: 500;")
+        self._set_connection_status(False, DISCONNECTED_TEXT)
         self.speed_test_panel.set_connected(False)
         self.connect_action.setText("Connect")
         
@@ -814,7 +1008,9 @@ class MainWindow(QMainWindow):
             self.data_engine.set_poll_interval(interval)
             self.project.views.poll_interval = interval
         except ValueError:
-            pass
+            return
+        # Show the new rate right away rather than on the next status tick
+        self._update_status()
     
     def _open_scan_dialog(self) -> None:
         """Open the Modbus device scan dialog."""
@@ -828,6 +1024,8 @@ class MainWindow(QMainWindow):
             self.connect_action.setChecked(False)
             self._disconnect()
             
+        from src.ui.scan_dialog import ScanDialog
+        
         dialog = ScanDialog(
             parent=self,
             initial_port=self.port_combo.currentData() or "",
@@ -851,9 +1049,7 @@ class MainWindow(QMainWindow):
     def _on_scan_connect_requested(self, settings: dict) -> None:
         """Handle connection request from scan dialog."""
         # Update UI with scanned settings
-        index = self.port_combo.findData(settings["port"])
-        if index >= 0:
-            self.port_combo.setCurrentIndex(index)
+        self._select_port(settings["port"])
         
         # Store found devices and selected slave IDs
         self._found_devices = settings.get("found_devices", settings.get("slave_ids", []))
@@ -876,17 +1072,6 @@ class MainWindow(QMainWindow):
     
     def _show_about(self) -> None:
         """Show about dialog."""
-        # Try to find icon for about dialog
-        icon_path = ""
-        possible_paths = [
-            os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "assets", "icon.png"),
-            os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "icon.png"),
-        ]
-        for p in possible_paths:
-            if os.path.exists(p):
-                icon_path = p
-                break
-
         about_text = (
             "<h2>Modbus Viewer</h2>"
             "<p>A modern GUI for Modbus RTU communication.</p>"
@@ -900,20 +1085,50 @@ class MainWindow(QMainWindow):
             "</ul>"
         )
         
-        if icon_path:
+        box = QMessageBox(self)
+        box.setWindowTitle("About Modbus Viewer")
+        box.setTextFormat(Qt.TextFormat.RichText)
+        box.setText(about_text)
+        if ABOUT_ICON_PATH:
             # Add icon to about dialog if it exists
-            about_text = f"<table><tr><td><img src='{icon_path}' width='64'></td><td style='padding-left: 20px;'>{about_text}</td></tr></table>"
-
-        QMessageBox.about(self, "About Modbus Viewer", about_text)
+            box.setIconPixmap(self._about_icon())
+        box.exec()
+    
+    def _about_icon(self) -> QPixmap:
+        """Load the about icon decoded straight at display size (the asset is ~1300 px)."""
+        if self._about_pixmap is None:
+            reader = QImageReader(ABOUT_ICON_PATH)
+            size = reader.size()
+            if size.isValid():
+                reader.setScaledSize(size.scaled(
+                    ABOUT_ICON_SIZE, ABOUT_ICON_SIZE, Qt.AspectRatioMode.KeepAspectRatio
+                ))
+            self._about_pixmap = QPixmap.fromImageReader(reader)
+        return self._about_pixmap
     
     # Event handlers
     
+    def _schedule_data_refresh(self) -> None:
+        """Queue a panel refresh for new engine data (one per event loop pass)."""
+        if not self._data_refresh_timer.isActive():
+            self._data_refresh_timer.start()
+    
     def _on_data_updated(self) -> None:
-        """Handle data update from engine."""
-        self.table_view.update_values()
-        self.plot_view.update_plot(self.data_engine)
-        self.variables_panel.update_values()
-        self.bits_panel.update_values()
+        """Refresh visible panels from the latest engine data."""
+        # Panels hidden behind another dock tab (or closed) are refreshed when shown
+        if self.table_view.isVisible():
+            self.table_view.update_values()
+        if self.plot_view.isVisible():
+            self.plot_view.update_plot(self.data_engine)
+        if self.variables_panel.isVisible():
+            self.variables_panel.update_values()
+        if self.bits_panel.isVisible():
+            self.bits_panel.update_values()
+    
+    def _on_dock_visibility_changed(self, visible: bool) -> None:
+        """Bring a panel up to date when its dock becomes visible."""
+        if visible:
+            self._on_data_updated()
     
     def _on_error(self, message: str) -> None:
         """Handle error from engine."""
@@ -922,10 +1137,11 @@ class MainWindow(QMainWindow):
     def _on_connection_lost(self) -> None:
         """Handle lost connection."""
         self.connect_action.setChecked(False)
-        self.connect_action.setText("Connect")
-        # Keep device selection so user can easily reconnect
-        self.speed_test_panel.set_connected(False)
+        # _disconnect resets the button text and speed test panel; device selection is kept
         self._disconnect()
+        # Usually an unplugged adapter; re-enumerate rather than serve the cached list
+        invalidate_ports_cache()
+        self._refresh_ports()
         QMessageBox.warning(self, "Connection Lost", "Connection to Modbus device was lost.")
     
     def _on_write_requested(self, register, value) -> None:
@@ -952,13 +1168,34 @@ class MainWindow(QMainWindow):
     def _update_status(self) -> None:
         """Update status bar."""
         if self.data_engine.is_running:
-            stats = self.data_engine.statistics
-            self.poll_label.setText(f"Poll: {stats['poll_interval']}ms")
-            duration = stats['last_poll_duration']
-            self.poll_duration_label.setText(f"Actual: {duration:.1f}ms")
+            engine = self.data_engine
+            status = (f"Poll: {engine.poll_interval}ms", f"Actual: {engine.last_poll_duration:.1f}ms")
+            interval = STATUS_INTERVAL_POLLING_MS
         else:
-            self.poll_label.setText("Poll: --")
-            self.poll_duration_label.setText("Actual: --")
+            status = ("Poll: --", "Actual: --")
+            interval = STATUS_INTERVAL_IDLE_MS
+        
+        # Back off while connected but not polling (e.g. during a speed test)
+        if self._status_timer.interval() != interval:
+            self._status_timer.setInterval(interval)
+        
+        if status == self._poll_status:
+            return
+        
+        previous = self._poll_status or (None, None)
+        if status[0] != previous[0]:
+            self.poll_label.setText(status[0])
+        if status[1] != previous[1]:
+            self.poll_duration_label.setText(status[1])
+        self._poll_status = status
+    
+    def _set_connection_status(self, connected: bool, text: str) -> None:
+        """Set connection text, swapping dot and style only when the state changes."""
+        self.connection_label.setText(text)
+        if connected != self._connection_state:
+            self.connection_icon.setPixmap(self._dot_connected if connected else self._dot_disconnected)
+            self.connection_label.setStyleSheet(CONNECTED_STYLE if connected else DISCONNECTED_STYLE)
+            self._connection_state = connected
     
     def _update_register_count(self) -> None:
         """Update register count in status bar."""
@@ -970,9 +1207,7 @@ class MainWindow(QMainWindow):
         """Update UI from project data."""
         # Update toolbar settings
         settings = self.project.connection
-        index = self.port_combo.findData(settings.port)
-        if index >= 0:
-            self.port_combo.setCurrentIndex(index)
+        self._select_port(settings.port)
         
         # Update found devices from project
         self._found_devices = settings.found_devices.copy()
@@ -981,8 +1216,7 @@ class MainWindow(QMainWindow):
         
         self.baud_combo.setCurrentText(str(settings.baud_rate))
         
-        parity_map = {"N": "None", "E": "Even", "O": "Odd"}
-        self.parity_combo.setCurrentText(parity_map.get(settings.parity, "None"))
+        self.parity_combo.setCurrentText(PARITY_LABELS.get(settings.parity, "None"))
         
         self.stopbits_combo.setCurrentText(str(settings.stop_bits))
         self.timeout_spin.setValue(int(settings.timeout * 1000))
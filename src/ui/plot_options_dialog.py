@@ -3,19 +3,24 @@ Plot options dialog for customizing plot appearance.
 Supports multi-device with designator format.
 """
 
-from typing import List, Dict, Optional
+from collections import defaultdict
+from typing import List, Dict, Optional, Iterator
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
     QPushButton, QSpinBox, QDoubleSpinBox, QComboBox,
     QLabel, QGroupBox, QDialogButtonBox, QCheckBox,
     QScrollArea, QWidget, QFrame, QTabWidget
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 
 from src.models.register import Register
 from src.models.variable import Variable
 
 
+# Checkboxes created per event loop pass when populating large selections
+POPULATE_BATCH_SIZE = 50
+
+
 class PlotOptionsDialog(QDialog):
     """Dialog for customizing plot options with multi-device support."""
     
@@ -41,6 +46,13 @@ class PlotOptionsDialog(QDialog):
         
         self._register_checkboxes: Dict[str, QCheckBox] = {}  # designator -> checkbox
         self._variable_checkboxes: Dict[str, QCheckBox] = {}
+        self._pending_checkboxes: Optional[Iterator[None]] = None  # Unfinished population
+        
+        # Group registers by device once; the lists don't change while the dialog lives
+        self._registers_by_device: Dict[int, List[Register]] = defaultdict(list)
+        for reg in self.registers:
+            self._registers_by_device[reg.slave_id].append(reg)
+        self._device_ids: List[int] = sorted(self._registers_by_device)
         
         self.setWindowTitle("Plot Options")
         self.setMinimumSize(700, 500)
@@ -239,7 +251,31 @@ class PlotOptionsDialog(QDialog):
         self._populate_checkboxes()
     
     def _populate_checkboxes(self) -> None:
-        """Populate register and variable checkboxes."""
+        """Populate register and variable checkboxes in batches."""
+        self._pending_checkboxes = self._create_checkboxes()
+        # First batch is created right away, the rest between event loop passes
+        self._populate_step()
+    
+    def _populate_step(self) -> None:
+        """Create the next batch of checkboxes, then yield to the event loop."""
+        if self._pending_checkboxes is None:
+            return
+        try:
+            next(self._pending_checkboxes)
+        except StopIteration:
+            self._pending_checkboxes = None
+            return
+        QTimer.singleShot(0, self._populate_step)
+    
+    def _finish_populate(self) -> None:
+        """Create any checkboxes still pending so the selection is complete."""
+        if self._pending_checkboxes is not None:
+            for _ in self._pending_checkboxes:
+                pass
+            self._pending_checkboxes = None
+    
+    def _create_checkboxes(self) -> Iterator[None]:
+        """Create register and variable checkboxes, yielding after each batch."""
         # Clear existing register tabs
         self.reg_tabs.clear()
         self._register_checkboxes.clear()
@@ -249,15 +285,14 @@ class PlotOptionsDialog(QDialog):
             checkbox.deleteLater()
         self._variable_checkboxes.clear()
         
-        # Group registers by device
-        by_device: Dict[int, List[Register]] = {}
-        for reg in self.registers:
-            if reg.slave_id not in by_device:
-                by_device[reg.slave_id] = []
-            by_device[reg.slave_id].append(reg)
+        # Selection lookups as sets (selections are lists of designators)
+        selected_registers = set(self.selected_registers)
+        selected_variables = set(self.selected_variables)
+        
+        created = 0
         
         # Create register checkboxes in tabs grouped by device
-        for slave_id in sorted(by_device.keys()):
+        for slave_id in self._device_ids:
             # Create tab content
             tab_widget = QWidget()
             tab_layout = QVBoxLayout(tab_widget)
@@ -270,17 +305,20 @@ class PlotOptionsDialog(QDialog):
             scroll.setWidgetResizable(True)
             scroll.setFrameShape(QFrame.Shape.NoFrame)
             scroll.setWidget(tab_widget)
+            self.reg_tabs.addTab(scroll, f"Device {slave_id}")
             
-            for reg in by_device[slave_id]:
+            for reg in self._registers_by_device[slave_id]:
                 label = reg.label if reg.label else f"R{reg.address}"
                 checkbox = QCheckBox(label)
                 checkbox.setStyleSheet("font-size: 11px;")
                 checkbox.setToolTip(reg.designator)
-                checkbox.setChecked(reg.designator in self.selected_registers)
+                checkbox.setChecked(reg.designator in selected_registers)
                 tab_layout.addWidget(checkbox)
                 self._register_checkboxes[reg.designator] = checkbox
-            
-            self.reg_tabs.addTab(scroll, f"Device {slave_id}")
+                
+                created += 1
+                if created % POPULATE_BATCH_SIZE == 0:
+                    yield
         
         # Create variable checkboxes
         for var in self.variables:
@@ -291,27 +329,58 @@ class PlotOptionsDialog(QDialog):
             checkbox = QCheckBox(label)
             checkbox.setStyleSheet("font-size: 11px;")
             checkbox.setToolTip(var.designator)
-            checkbox.setChecked(var.designator in self.selected_variables)
+            checkbox.setChecked(var.designator in selected_variables)
             self.variable_layout.addWidget(checkbox)
             self._variable_checkboxes[var.designator] = checkbox
+            
+            created += 1
+            if created % POPULATE_BATCH_SIZE == 0:
+                yield
+    
+    def set_options(self, line_width: float, grid_alpha: float, show_legend: bool,
+                    time_window_index: int, y_auto_scale: bool, y_min: float, y_max: float,
+                    selected_registers: List[str], selected_variables: List[str]) -> None:
+        """Reload option values and selections without rebuilding the checkbox lists."""
+        self._finish_populate()
+        self.time_combo.setCurrentIndex(time_window_index)
+        self.line_width_spin.setValue(line_width)
+        self.grid_alpha_spin.setValue(grid_alpha)
+        self.y_auto_scale_check.setChecked(y_auto_scale)
+        self.y_min_spin.setValue(y_min)
+        self.y_max_spin.setValue(y_max)
+        self._on_auto_scale_toggled(y_auto_scale)
+        self.show_legend_check.setChecked(show_legend)
+        
+        self.selected_registers = selected_registers
+        self.selected_variables = selected_variables
+        registers = set(selected_registers)
+        variables = set(selected_variables)
+        for designator, checkbox in self._register_checkboxes.items():
+            checkbox.setChecked(designator in registers)
+        for designator, checkbox in self._variable_checkboxes.items():
+            checkbox.setChecked(designator in variables)
     
     def _select_all_registers(self) -> None:
         """Select all register checkboxes."""
+        self._finish_populate()
         for checkbox in self._register_checkboxes.values():
             checkbox.setChecked(True)
     
     def _select_none_registers(self) -> None:
         """Deselect all register checkboxes."""
+        self._finish_populate()
         for checkbox in self._register_checkboxes.values():
             checkbox.setChecked(False)
     
     def _select_all_variables(self) -> None:
         """Select all variable checkboxes."""
+        self._finish_populate()
         for checkbox in self._variable_checkboxes.values():
             checkbox.setChecked(True)
     
     def _select_none_variables(self) -> None:
         """Deselect all variable checkboxes."""
+        self._finish_populate()
         for checkbox in self._variable_checkboxes.values():
             checkbox.setChecked(False)
     
@@ -322,6 +391,7 @@ class PlotOptionsDialog(QDialog):
     
     def get_options(self) -> dict:
         """Get the selected options."""
+        self._finish_populate()
         selected_registers = [
             designator for designator, checkbox in self._register_checkboxes.items()
             if checkbox.isChecked()
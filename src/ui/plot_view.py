@@ -52,7 +52,10 @@ class PlotView(QFrame):
         self.setLineWidth(1)
         self.registers: List[Register] = []
         self.variables: List[Variable] = []
+        self._register_index: Dict[str, int] = {}  # designator -> index in self.registers
+        self._variable_index: Dict[str, int] = {}  # designator -> index in self.variables
         self._plot_items: Dict[str, pg.PlotDataItem] = {}  # Key: "D1.R0" or "var_name"
+        self._options_dialog: Optional[PlotOptionsDialog] = None  # Reused until registers/variables change
         self._time_window = 60.0  # seconds
         self._is_paused = False
         
@@ -139,20 +142,35 @@ class PlotView(QFrame):
     
     def _show_options(self) -> None:
         """Show plot options dialog."""
-        dialog = PlotOptionsDialog(
-            line_width=self._line_width,
-            grid_alpha=self._grid_alpha,
-            show_legend=self._show_legend,
-            time_window_index=self.time_combo.currentIndex(),
-            y_auto_scale=self._y_auto_scale,
-            y_min=self._y_min,
-            y_max=self._y_max,
-            registers=self.registers,
-            variables=self.variables,
-            selected_registers=self.get_selected_registers(),
-            selected_variables=self.get_selected_variables(),
-            parent=self
-        )
+        if self._options_dialog is None:
+            self._options_dialog = PlotOptionsDialog(
+                line_width=self._line_width,
+                grid_alpha=self._grid_alpha,
+                show_legend=self._show_legend,
+                time_window_index=self.time_combo.currentIndex(),
+                y_auto_scale=self._y_auto_scale,
+                y_min=self._y_min,
+                y_max=self._y_max,
+                registers=self.registers,
+                variables=self.variables,
+                selected_registers=self.get_selected_registers(),
+                selected_variables=self.get_selected_variables(),
+                parent=self
+            )
+        else:
+            # Checkbox lists are still valid, only reload the current values
+            self._options_dialog.set_options(
+                line_width=self._line_width,
+                grid_alpha=self._grid_alpha,
+                show_legend=self._show_legend,
+                time_window_index=self.time_combo.currentIndex(),
+                y_auto_scale=self._y_auto_scale,
+                y_min=self._y_min,
+                y_max=self._y_max,
+                selected_registers=self.get_selected_registers(),
+                selected_variables=self.get_selected_variables(),
+            )
+        dialog = self._options_dialog
         
         if dialog.exec():
             options = dialog.get_options()
@@ -201,23 +219,37 @@ class PlotView(QFrame):
                 )
                 plot_item.setPen(new_pen)
     
+    def _discard_options_dialog(self) -> None:
+        """Drop the cached options dialog so it is rebuilt on next open."""
+        if self._options_dialog is not None:
+            self._options_dialog.deleteLater()
+            self._options_dialog = None
+    
     def set_registers(self, registers: List[Register]) -> None:
         """Set the list of registers available for plotting."""
+        self._discard_options_dialog()
         self.registers = registers
+        self._register_index = {}
+        for i, reg in enumerate(registers):
+            self._register_index.setdefault(reg.designator, i)
         self._sync_plot_items()
 
     def set_variables(self, variables: List[Variable]) -> None:
         """Set the list of variables available for plotting."""
+        self._discard_options_dialog()
         self.variables = variables
+        self._variable_index = {}
+        for i, var in enumerate(variables):
+            self._variable_index.setdefault(var.designator, i)
         self._sync_plot_items()
 
     def _sync_plot_items(self) -> None:
         """Sync plot items with current registers and variables."""
-        # Get all valid designators
-        all_valid = {reg.designator for reg in self.registers} | {var.designator for var in self.variables}
-        
         # Remove plot items for designators that no longer exist
-        keys_to_remove = [k for k in self._plot_items.keys() if k not in all_valid]
+        keys_to_remove = [
+            k for k in self._plot_items.keys()
+            if k not in self._register_index and k not in self._variable_index
+        ]
         for key in keys_to_remove:
             self.plot_widget.removeItem(self._plot_items[key])
             del self._plot_items[key]
@@ -262,20 +294,18 @@ class PlotView(QFrame):
     
     def get_selected_registers(self) -> List[str]:
         """Get list of selected register designators (e.g., ['D1.R0', 'D2.R5'])."""
-        reg_designators = {reg.designator for reg in self.registers}
-        return [k for k in self._plot_items.keys() if k in reg_designators]
+        return [k for k in self._plot_items.keys() if k in self._register_index]
     
     def get_selected_variables(self) -> List[str]:
         """Get list of selected variable designators."""
-        var_designators = {var.designator for var in self.variables}
-        return [k for k in self._plot_items.keys() if k in var_designators]
+        return [k for k in self._plot_items.keys() if k in self._variable_index]
     
     def set_selected_registers(self, designators: List[str]) -> None:
         """Set which registers are selected for plotting by designator."""
         # Remove plots for registers no longer in designators list
-        reg_designators = {reg.designator for reg in self.registers}
+        selected = set(designators)
         for key in list(self._plot_items.keys()):
-            if key in reg_designators and key not in designators:
+            if key in self._register_index and key not in selected:
                 self.plot_widget.removeItem(self._plot_items[key])
                 del self._plot_items[key]
         
@@ -283,10 +313,11 @@ class PlotView(QFrame):
         for designator in designators:
             if designator not in self._plot_items:
                 # Find register by designator
-                reg = next((r for r in self.registers if r.designator == designator), None)
+                index = self._register_index.get(designator)
                 
-                if reg:
-                    color_index = self.registers.index(reg) % len(PLOT_COLORS)
+                if index is not None:
+                    reg = self.registers[index]
+                    color_index = index % len(PLOT_COLORS)
                     color = PLOT_COLORS[color_index]
                     pen = pg.mkPen(color=color, width=self._line_width)
                     label = f"D{reg.slave_id}.{reg.label}" if reg.label else designator
@@ -297,9 +328,9 @@ class PlotView(QFrame):
     def set_selected_variables(self, designators: List[str]) -> None:
         """Set which variables are selected for plotting by designator."""
         # Remove plots for variables no longer in designators list
-        var_designators = {var.designator for var in self.variables}
+        selected = set(designators)
         for key in list(self._plot_items.keys()):
-            if key in var_designators and key not in designators:
+            if key in self._variable_index and key not in selected:
                 self.plot_widget.removeItem(self._plot_items[key])
                 del self._plot_items[key]
         
@@ -307,10 +338,11 @@ class PlotView(QFrame):
         for designator in designators:
             if designator not in self._plot_items:
                 # Find variable by designator
-                var = next((v for v in self.variables if v.designator == designator), None)
+                index = self._variable_index.get(designator)
                 
-                if var:
-                    color_index = (self.variables.index(var) + len(self.registers)) % len(PLOT_COLORS)
+                if index is not None:
+                    var = self.variables[index]
+                    color_index = (index + len(self.registers)) % len(PLOT_COLORS)
                     color = PLOT_COLORS[color_index]
                     pen = pg.mkPen(color=color, width=self._line_width)
                     label = var.label or var.name
@@ -9,7 +9,7 @@ from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
     QPushButton, QComboBox, QLineEdit, QSpinBox, QDoubleSpinBox, QHeaderView,
     QAbstractItemView, QMessageBox, QDialogButtonBox, QLabel,
-    QFileDialog, QWidget, QCheckBox
+    QFileDialog, QWidget
 )
 from PySide6.QtCore import Qt, QSettings
 import json
@@ -185,15 +185,11 @@ class RegisterEditorDialog(QDialog):
         format_combo.setCurrentText(reg.display_format.value)
         self.table.setCellWidget(row, 5, format_combo)
         
-        # 6: Fast Poll checkbox
-        fast_widget = QWidget()
-        fast_layout = QHBoxLayout(fast_widget)
-        fast_layout.setContentsMargins(0, 0, 0, 0)
-        fast_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        fast_check = QCheckBox()
-        fast_check.setChecked(reg.fast_poll)
-        fast_layout.addWidget(fast_check)
-        self.table.setCellWidget(row, 6, fast_widget)
+        # 6: Fast Poll checkbox (checkable item, no per-row widget)
+        fast_item = QTableWidgetItem()
+        fast_item.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsUserCheckable)
+        fast_item.setCheckState(Qt.CheckState.Checked if reg.fast_poll else Qt.CheckState.Unchecked)
+        self.table.setItem(row, 6, fast_item)
     
     def _get_row(self, row: int) -> Register:
         """Get register from a table row."""
@@ -203,14 +199,8 @@ class RegisterEditorDialog(QDialog):
         order_combo = self.table.cellWidget(row, 3)
         access_combo = self.table.cellWidget(row, 4)
         format_combo = self.table.cellWidget(row, 5)
-        fast_widget = self.table.cellWidget(row, 6)
-        
-        # Extract checkbox from the wrapper widget
-        fast_poll = False
-        if fast_widget:
-            fast_check = fast_widget.findChild(QCheckBox)
-            if fast_check:
-                fast_poll = fast_check.isChecked()
+        fast_item = self.table.item(row, 6)
+        fast_poll = fast_item is not None and fast_item.checkState() == Qt.CheckState.Checked
         
         return Register(
             label=label_edit.text(),
@@ -10,10 +10,10 @@ from PySide6.QtWidgets import (
     QSpinBox, QPushButton, QProgressBar, QTableWidget, QTableWidgetItem,
     QFormLayout, QGroupBox, QMessageBox, QHeaderView, QWidget, QCheckBox
 )
-from PySide6.QtCore import Qt, QThread, Signal, Slot, QSettings
+from PySide6.QtCore import Qt, QThread, Signal, Slot, QSettings, QTimer
 
 from src.core.modbus_manager import ModbusManager
-from src.utils.serial_ports import get_available_ports
+from src.utils.serial_ports import get_available_ports, BAUD_RATES, PARITY_CODES, STOP_BITS
 from src.ui.styles import COLORS
 
 
@@ -48,22 +48,24 @@ class ScanWorker(QThread):
         
     def run(self):
         found_ids = []
+        instrument = None
         try:
+            # Open the port once for the whole sweep instead of once per ID
+            instrument = ModbusManager.open_probe_instrument(
+                port=self.port,
+                baud_rate=self.baud_rate,
+                parity=self.parity,
+                stop_bits=self.stop_bits,
+                timeout=self.timeout
+            )
+            
             for slave_id in range(1, 248):
                 if self._is_cancelled:
                     break
                 
                 self.progress.emit(slave_id)
                 
-                if ModbusManager.probe_device(
-                    port=self.port,
-                    slave_id=slave_id,
-                    baud_rate=self.baud_rate,
-                    register_address=self.register_address,
-                    parity=self.parity,
-                    stop_bits=self.stop_bits,
-                    timeout=self.timeout
-                ):
+                if ModbusManager.probe_slave(instrument, slave_id, self.register_address):
                     found_ids.append(slave_id)
                     self.found.emit(slave_id)
                 
@@ -73,6 +75,9 @@ class ScanWorker(QThread):
             self.finished.emit(found_ids)
         except Exception as e:
             self.error.emit(str(e))
+        finally:
+            if instrument is not None and instrument.serial.is_open:
+                instrument.serial.close()
 
 
 class ScanDialog(QDialog):
@@ -90,6 +95,15 @@ class ScanDialog(QDialog):
         self.worker: Optional[ScanWorker] = None
         self.found_ids: List[int] = []
         self._device_checkboxes: dict = {}  # slave_id -> QCheckBox
+        self._close_requested = False  # Close once the running scan has stopped
+        
+        # Progress updates are coalesced to at most ~30 repaints per second
+        self._pending_progress: Optional[int] = None
+        self._last_progress_update = 0.0
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(33)
+        self._progress_timer.timeout.connect(self._flush_progress)
         
         self._setup_ui(initial_port, initial_baud)
         
@@ -125,15 +139,15 @@ class ScanDialog(QDialog):
         advanced_layout.setContentsMargins(10, 0, 0, 0)
         
         self.baud_combo = QComboBox()
-        self.baud_combo.addItems(["9600", "19200", "38400", "57600", "115200", "230400", "460800"])
+        self.baud_combo.addItems(list(BAUD_RATES))
         self.baud_combo.setCurrentText(str(initial_baud))
         
         self.parity_combo = QComboBox()
-        self.parity_combo.addItems(["None", "Even", "Odd"])
+        self.parity_combo.addItems(list(PARITY_CODES))
         self.parity_combo.setCurrentText("None")
         
         self.stopbits_combo = QComboBox()
-        self.stopbits_combo.addItems(["1", "2"])
+        self.stopbits_combo.addItems(list(STOP_BITS))
         self.stopbits_combo.setCurrentText("1")
 
         self.register_spin = QSpinBox()
@@ -298,8 +312,7 @@ class ScanDialog(QDialog):
             return
             
         baud = int(self.baud_combo.currentText())
-        parity_map = {"None": "N", "Even": "E", "Odd": "O"}
-        parity = parity_map.get(self.parity_combo.currentText(), "N")
+        parity = PARITY_CODES.get(self.parity_combo.currentText(), "N")
         stop_bits = int(self.stopbits_combo.currentText())
         reg = self.register_spin.value()
         timeout = self.timeout_spin.value() / 1000.0
@@ -343,7 +356,19 @@ class ScanDialog(QDialog):
             self.scan_btn.setEnabled(False)
             
     def _on_progress(self, slave_id: int):
-        self.progress_bar.setValue(slave_id)
+        self._pending_progress = slave_id
+        if time.monotonic() - self._last_progress_update >= 0.033:
+            self._flush_progress()
+        elif not self._progress_timer.isActive():
+            self._progress_timer.start()
+    
+    def _flush_progress(self):
+        """Show the latest pending progress value."""
+        self._progress_timer.stop()
+        if self._pending_progress is not None:
+            self.progress_bar.setValue(self._pending_progress)
+            self._pending_progress = None
+        self._last_progress_update = time.monotonic()
         
     def _on_found(self, slave_id: int):
         self.found_ids.append(slave_id)
@@ -397,13 +422,19 @@ class ScanDialog(QDialog):
 
     def _select_all_devices(self):
         """Select all found devices."""
-        for checkbox in self._device_checkboxes.values():
-            checkbox.setChecked(True)
+        self._set_all_devices_checked(True)
 
     def _select_no_devices(self):
         """Deselect all devices."""
+        self._set_all_devices_checked(False)
+
+    def _set_all_devices_checked(self, checked: bool):
+        """Set every device checkbox, refreshing the connect button once."""
         for checkbox in self._device_checkboxes.values():
-            checkbox.setChecked(False)
+            checkbox.blockSignals(True)
+            checkbox.setChecked(checked)
+            checkbox.blockSignals(False)
+        self._update_connect_button()
 
     def _connect_selected(self):
         """Connect to selected devices."""
@@ -425,6 +456,17 @@ class ScanDialog(QDialog):
         self.accept()
         
     def _on_finished(self, found_ids: list):
+        self._flush_progress()
+        if self._close_requested:
+            # The worker has emitted its last signal, so this wait is short
+            self._close_requested = False
+            self.worker.wait()
+            # Keep the devices found before the scan was stopped
+            if found_ids:
+                self.devices_found.emit(found_ids)
+            self.close()
+            return
+        
         self.scan_btn.setText("Start Scan")
         self.scan_btn.setEnabled(True)
         self.port_combo.setEnabled(True)
@@ -442,13 +484,19 @@ class ScanDialog(QDialog):
             self.devices_found.emit(found_ids)
             
     def _on_error(self, message: str):
+        if self._close_requested:
+            self._on_finished([])
+            return
         QMessageBox.critical(self, "Scan Error", f"An error occurred during scan:\n{message}")
         self._on_finished([])
 
     def closeEvent(self, event):
         if self.worker and self.worker.isRunning():
-            self.worker.cancel()
-            self.worker.wait()
+            # Don't block the GUI thread on a probe mid-timeout; close from _on_finished
+            self._close_requested = True
+            self._stop_scan()
+            event.ignore()
+            return
         event.accept()
     
     def get_found_devices(self) -> List[int]:
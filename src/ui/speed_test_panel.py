@@ -4,6 +4,7 @@ Supports multi-device with device selector.
 """
 
 import time
+from collections import Counter
 from typing import List, Dict, Tuple
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
@@ -305,12 +306,11 @@ class SpeedTestPanel(QWidget):
         current_device = self.device_combo.currentData()
         self.device_combo.clear()
         
-        # Get unique slave IDs
-        slave_ids = sorted(set(reg.slave_id for reg in self.registers))
+        # Count registers per slave ID in a single pass
+        counts = Counter(reg.slave_id for reg in self.registers)
         
-        for slave_id in slave_ids:
-            count = sum(1 for r in self.registers if r.slave_id == slave_id)
-            self.device_combo.addItem(f"Device {slave_id} ({count} regs)", slave_id)
+        for slave_id in sorted(counts):
+            self.device_combo.addItem(f"Device {slave_id} ({counts[slave_id]} regs)", slave_id)
         
         # Restore selection or select first
         if current_device is not None:
@@ -325,24 +325,31 @@ class SpeedTestPanel(QWidget):
         """Handle device selection change."""
         slave_id = self.device_combo.currentData()
         
-        # Clear existing checkboxes
-        for cb in self._register_checkboxes.values():
-            cb.deleteLater()
-        self._register_checkboxes.clear()
-        
-        if slave_id is None:
-            self._current_device_regs = []
-            return
-        
-        # Filter registers for selected device
-        self._current_device_regs = [r for r in self.registers if r.slave_id == slave_id]
-        
-        # Add new checkboxes
-        for reg in self._current_device_regs:
-            cb = QCheckBox(reg.label or f"R{reg.address}")
-            cb.setToolTip(reg.designator)
-            self.scroll_layout.addWidget(cb)
-            self._register_checkboxes[reg.address] = cb
+        # Batch the checkbox swap into a single relayout/repaint
+        self.scroll_content.setUpdatesEnabled(False)
+        try:
+            # Clear existing checkboxes
+            while self.scroll_layout.count():
+                item = self.scroll_layout.takeAt(0)
+                if item.widget():
+                    item.widget().deleteLater()
+            self._register_checkboxes.clear()
+            
+            if slave_id is None:
+                self._current_device_regs = []
+                return
+            
+            # Filter registers for selected device
+            self._current_device_regs = [r for r in self.registers if r.slave_id == slave_id]
+            
+            # Add new checkboxes
+            for reg in self._current_device_regs:
+                cb = QCheckBox(reg.label or f"R{reg.address}")
+                cb.setToolTip(reg.designator)
+                self.scroll_layout.addWidget(cb)
+                self._register_checkboxes[reg.address] = cb
+        finally:
+            self.scroll_content.setUpdatesEnabled(True)
             
     def set_connected(self, connected: bool):
         """Update connection state."""
@@ -373,7 +380,7 @@ class SpeedTestPanel(QWidget):
             self.status_label.setStyleSheet(f"color: {COLORS['error']};")
             return
             
-        selected_addresses = [addr for addr, cb in self._register_checkboxes.items() if cb.isChecked()]
+        selected_addresses = {addr for addr, cb in self._register_checkboxes.items() if cb.isChecked()}
         selected_registers = [reg for reg in self._current_device_regs if reg.address in selected_addresses]
         
         if not selected_registers:
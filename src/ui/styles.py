@@ -552,24 +552,24 @@ QDialogButtonBox QPushButton {
 """
 
 
+# Looked up once; the filter below sees every event in the application
+_POLISH_EVENT = QEvent.Type.Polish
+_NO_BUTTONS = QAbstractSpinBox.ButtonSymbols.NoButtons
+
+
 class SpinBoxNoButtonsFilter(QObject):
     """Global event filter that removes buttons from all spinboxes."""
     
-    def __init__(self):
-        super().__init__()
-        self._processed = set()
-    
     def eventFilter(self, obj, event):
-        try:
-            if event.type() in (QEvent.Type.Show, QEvent.Type.Polish):
-                if isinstance(obj, (QSpinBox, QDoubleSpinBox)):
-                    if id(obj) not in self._processed:
-                        self._processed.add(id(obj))
-                        obj.setButtonSymbols(QAbstractSpinBox.ButtonSymbols.NoButtons)
-        except (KeyboardInterrupt, SystemExit):
-            raise
-        except Exception:
-            pass
+        # Every widget is polished once before it is first shown
+        if event.type() == _POLISH_EVENT and isinstance(obj, (QSpinBox, QDoubleSpinBox)):
+            try:
+                if obj.buttonSymbols() != _NO_BUTTONS:
+                    obj.setButtonSymbols(_NO_BUTTONS)
+            except (KeyboardInterrupt, SystemExit):
+                raise
+            except Exception:
+                pass
         
         return False
 
@@ -577,18 +577,31 @@ class SpinBoxNoButtonsFilter(QObject):
 # Global instance of the filter
 _spinbox_filter = None
 
+# Application the theme was last applied to
+_themed_app = None
+
 
 def apply_theme(app: QApplication) -> None:
     """Apply the light theme to the application."""
+    global _spinbox_filter, _themed_app
+    
+    # Re-applying the stylesheet repolishes every widget, so only do it once per app
+    if app is _themed_app:
+        return
+    _themed_app = app
+    
+    # Set the palette first so the stylesheet polish below is the only full repolish
+    _apply_palette(app)
     app.setStyleSheet(STYLESHEET)
     
     # Install global event filter to remove spinbox buttons
-    global _spinbox_filter
     if _spinbox_filter is None:
         _spinbox_filter = SpinBoxNoButtonsFilter()
     app.installEventFilter(_spinbox_filter)
-    
-    # Also set palette for native widgets
+
+
+def _apply_palette(app: QApplication) -> None:
+    """Set the palette for native widgets."""
     palette = QPalette()
     palette.setColor(QPalette.ColorRole.Window, QColor(COLORS['bg_secondary']))
     palette.setColor(QPalette.ColorRole.WindowText, QColor(COLORS['text_primary']))
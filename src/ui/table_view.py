@@ -11,7 +11,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Signal, Qt, QSettings
 from PySide6.QtGui import QColor, QBrush
 
-from src.models.register import Register, AccessMode, DisplayFormat
+from src.models.register import Register, DisplayFormat, WRITABLE_ACCESS_MODES
 from src.ui.styles import COLORS
 
 
@@ -31,6 +31,8 @@ class TableView(QFrame):
         self._live_registers: List[Register] = []  # All live instances across all devices
         self._pending_writes: Dict[Tuple[int, int], float] = {}  # (slave_id, address) -> new value
         self._device_tables: Dict[int, QTableWidget] = {}  # slave_id -> table
+        self._row_index: Dict[Tuple[int, int], Tuple[Register, int]] = {}  # (slave_id, address) -> (live register, row)
+        self._device_registers: Dict[int, List[Register]] = {}  # slave_id -> live registers in row order
         self._setup_ui()
         self._load_settings()
     
@@ -101,7 +103,8 @@ class TableView(QFrame):
     def _load_settings(self) -> None:
         """Load table settings."""
         settings = QSettings()
-        # Settings are per-table, handled in rebuild
+        # Settings are per-table, handled in rebuild; keep the stored state to skip no-op saves
+        self._stored_header_state = settings.value("table_view/header_state")
 
     def save_settings(self) -> None:
         """Save table settings."""
@@ -109,15 +112,20 @@ class TableView(QFrame):
         # Save first table's header state as default
         if self._device_tables:
             first_table = next(iter(self._device_tables.values()))
-            settings.setValue("table_view/header_state", first_table.horizontalHeader().saveState())
+            header_state = first_table.horizontalHeader().saveState()
+            if header_state != self._stored_header_state:
+                settings.setValue("table_view/header_state", header_state)
+                self._stored_header_state = header_state
     
     def _edit_registers(self) -> None:
         """Request to open register editor."""
         self.edit_registers_requested.emit()
     
-    def set_registers(self, registers: List[Register]) -> None:
-        """Set the common register definitions."""
+    def set_registers(self, registers: List[Register], slave_ids: Optional[List[int]] = None) -> None:
+        """Set the common register definitions (and optionally slave IDs) with one rebuild."""
         self.register_definitions = registers
+        if slave_ids is not None:
+            self.slave_ids = slave_ids
         self._rebuild_tabs()
     
     def set_slave_ids(self, slave_ids: List[int]) -> None:
@@ -127,40 +135,52 @@ class TableView(QFrame):
     
     def _rebuild_tabs(self) -> None:
         """Rebuild tabs for each device using common definitions."""
-        # Clear existing tabs
-        self.tab_widget.clear()
-        self._device_tables.clear()
-        self._pending_writes.clear()
-        self._live_registers = []
-        self._update_write_button()
-        
-        # Create tab for each connected device
-        for slave_id in sorted(self.slave_ids):
-            table = self._create_table()
-            self._device_tables[slave_id] = table
-            
-            # Create live instances for this device
-            device_regs = []
-            for reg_def in self.register_definitions:
-                live_reg = reg_def.copy()
-                live_reg.slave_id = slave_id
-                device_regs.append(live_reg)
-                self._live_registers.append(live_reg)
+        # Suspend repaints while tabs are torn down and repopulated
+        self.tab_widget.setUpdatesEnabled(False)
+        try:
+            # Clear existing tabs (QTabWidget.clear() does not delete the pages)
+            for index in range(self.tab_widget.count()):
+                self.tab_widget.widget(index).deleteLater()
+            self.tab_widget.clear()
+            self._device_tables.clear()
+            self._pending_writes.clear()
+            self._live_registers = []
+            self._row_index.clear()
+            self._device_registers.clear()
+            self._update_write_button()
             
-            # Block signals during rebuild
-            table.blockSignals(True)
-            try:
-                self._populate_table(table, device_regs)
-            finally:
-                table.blockSignals(False)
+            # Create tab for each connected device
+            for slave_id in sorted(self.slave_ids):
+                table = self._create_table()
+                self._device_tables[slave_id] = table
+                
+                # Create live instances for this device
+                device_regs = []
+                for row, reg_def in enumerate(self.register_definitions):
+                    live_reg = reg_def.copy()
+                    live_reg.slave_id = slave_id
+                    device_regs.append(live_reg)
+                    self._live_registers.append(live_reg)
+                    # First definition wins for duplicated addresses
+                    self._row_index.setdefault((slave_id, live_reg.address), (live_reg, row))
+                self._device_registers[slave_id] = device_regs
+                
+                # Block signals during rebuild
+                table.blockSignals(True)
+                try:
+                    self._populate_table(table, device_regs)
+                finally:
+                    table.blockSignals(False)
+                
+                self.tab_widget.addTab(table, f"Device {slave_id}")
             
-            self.tab_widget.addTab(table, f"Device {slave_id}")
-        
-        # If no devices, add empty tab
-        if not self.slave_ids:
-            table = self._create_table()
-            self._device_tables[0] = table
-            self.tab_widget.addTab(table, "No Devices")
+            # If no devices, add empty tab
+            if not self.slave_ids:
+                table = self._create_table()
+                self._device_tables[0] = table
+                self.tab_widget.addTab(table, "No Devices")
+        finally:
+            self.tab_widget.setUpdatesEnabled(True)
     
     def get_live_registers(self) -> List[Register]:
         """Get all live register instances across all devices."""
@@ -199,7 +219,7 @@ class TableView(QFrame):
             # New Value (editable for writable registers)
             new_value_item = QTableWidgetItem("")
             new_value_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            is_writable = reg.access_mode in (AccessMode.READ_WRITE, AccessMode.WRITE)
+            is_writable = reg.access_mode in WRITABLE_ACCESS_MODES
             if not is_writable:
                 new_value_item.setFlags(new_value_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
                 new_value_item.setForeground(QBrush(QColor(COLORS['text_disabled'])))
@@ -287,12 +307,10 @@ class TableView(QFrame):
     
     def _write_pending(self) -> None:
         """Write all pending values."""
-        for (slave_id, address), value in self._pending_writes.items():
-            # Find register in live instances
-            for reg in self._live_registers:
-                if reg.slave_id == slave_id and reg.address == address:
-                    self.write_requested.emit(reg, value)
-                    break
+        for key, value in self._pending_writes.items():
+            entry = self._row_index.get(key)
+            if entry:
+                self.write_requested.emit(entry[0], value)
         
         # Clear pending writes and new value fields
         self._pending_writes.clear()
@@ -315,24 +333,24 @@ class TableView(QFrame):
             return
         
         table = self._device_tables[slave_id]
+        key = (slave_id, address)
+        entry = self._row_index.get(key)
+        if not entry:
+            return
         
-        for row in range(table.rowCount()):
-            reg = self._get_register_from_table(table, row)
-            if reg and reg.slave_id == slave_id and reg.address == address:
-                item = table.item(row, 4)
-                if item:
-                    key = (slave_id, address)
-                    table.blockSignals(True)
-                    if reg.raw_value is not None and value == int(reg.raw_value):
-                        self._pending_writes.pop(key, None)
-                        item.setText("")
-                    else:
-                        self._pending_writes[key] = float(value)
-                        formatted = self._format_for_input(reg, value)
-                        item.setText(formatted)
-                    table.blockSignals(False)
-                    self._update_write_button()
-                break
+        reg, row = entry
+        item = table.item(row, 4)
+        if item:
+            table.blockSignals(True)
+            if reg.raw_value is not None and value == int(reg.raw_value):
+                self._pending_writes.pop(key, None)
+                item.setText("")
+            else:
+                self._pending_writes[key] = float(value)
+                formatted = self._format_for_input(reg, value)
+                item.setText(formatted)
+            table.blockSignals(False)
+            self._update_write_button()
     
     def _format_for_input(self, reg: Register, value: int) -> str:
         """Format value for input field based on register's display format."""
@@ -355,11 +373,7 @@ class TableView(QFrame):
         for slave_id, table in self._device_tables.items():
             table.blockSignals(True)
             try:
-                for row in range(table.rowCount()):
-                    reg = self._get_register_from_table(table, row)
-                    if not reg:
-                        continue
-                    
+                for row, reg in enumerate(self._device_registers.get(slave_id, [])):
                     # Value (showing scaled value)
                     value_item = table.item(row, 3)
                     if value_item:
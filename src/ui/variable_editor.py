@@ -3,6 +3,7 @@ Variable editor dialog for creating/editing computed variables.
 Supports multi-device with D<id>.R<addr> syntax.
 """
 
+import re
 from typing import List, Optional
 
 from PySide6.QtWidgets import (
@@ -14,10 +15,14 @@ from PySide6.QtCore import Qt
 
 from src.models.variable import Variable, VariableFormat
 from src.models.register import Register
-from src.core.variable_engine import VariableEvaluator
+from src.core.variable_engine import VariableEvaluator, localize_expression
 from src.ui.expression_highlighter import ExpressionHighlighter
 
 
+# Characters not allowed in generated variable names
+_NAME_INVALID_CHARS_RE = re.compile(r'[^a-zA-Z0-9]')
+
+
 class VariableEditorDialog(QDialog):
     """Dialog for creating or editing a variable with multi-device support."""
     
@@ -246,9 +251,8 @@ class VariableEditorDialog(QDialog):
                 return
             
             # Map R<addr> to D<sid>.R<addr> for preview using first sid
-            first_sid = sorted(set(r.slave_id for r in self.registers))[0]
-            import re
-            preview_expr = re.sub(r'(?<!\.)\bR(\d+)\b', f'D{first_sid}.R\\1', expression)
+            first_sid = min(r.slave_id for r in self.registers)
+            preview_expr = localize_expression(expression, first_sid)
         
         # Validate
         error = self.evaluator.validate(preview_expr)
@@ -299,8 +303,7 @@ class VariableEditorDialog(QDialog):
         label = self.label_edit.text().strip()
         self.variable.label = label
         # Generate name from label: lowercase, replace non-alphanumeric with underscores
-        import re
-        name = re.sub(r'[^a-zA-Z0-9]', '_', label).lower()
+        name = _NAME_INVALID_CHARS_RE.sub('_', label).lower()
         # Ensure it doesn't start with a number
         if name and name[0].isdigit():
             name = "v_" + name
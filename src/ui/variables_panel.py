@@ -2,7 +2,7 @@
 Variables panel for displaying computed variables.
 """
 
-from typing import List
+from typing import List, Dict, Optional
 
 from PySide6.QtWidgets import (
     QFrame, QVBoxLayout, QHBoxLayout, QPushButton,
@@ -14,11 +14,15 @@ from PySide6.QtGui import QColor, QBrush
 
 from src.models.variable import Variable
 from src.models.register import Register
-from src.core.variable_engine import VariableEvaluator
+from src.core.variable_engine import VariableEvaluator, localize_expression
 from src.ui.variable_editor import VariableEditorDialog
 from src.ui.styles import COLORS
 
 
+_VALUE_BRUSH = QBrush(QColor(COLORS['text_primary']))
+_ERROR_BRUSH = QBrush(QColor(COLORS['error']))
+
+
 class VariablesPanel(QFrame):
     """Panel for displaying and managing computed variables."""
     
@@ -35,6 +39,7 @@ class VariablesPanel(QFrame):
         self._live_variables: List[Variable] = []
         self.evaluator = VariableEvaluator()
         self._device_tables: Dict[int, QTableWidget] = {}  # slave_id -> table (0 for Global)
+        self._device_variables: Dict[int, List[Variable]] = {}  # slave_id -> variables in row order
         
         self._setup_ui()
         self._load_settings()
@@ -98,9 +103,11 @@ class VariablesPanel(QFrame):
         self.register_definitions = registers
         self.evaluator.set_registers(registers)
     
-    def set_variables(self, variables: List[Variable]) -> None:
-        """Set the list of variable definitions."""
+    def set_variables(self, variables: List[Variable], slave_ids: Optional[List[int]] = None) -> None:
+        """Set the list of variable definitions (and optionally slave IDs) with one rebuild."""
         self.variable_definitions = [v.copy() for v in variables]
+        if slave_ids is not None:
+            self.slave_ids = slave_ids
         self._rebuild_tabs()
     
     def set_slave_ids(self, slave_ids: List[int]) -> None:
@@ -118,41 +125,51 @@ class VariablesPanel(QFrame):
     
     def _rebuild_tabs(self) -> None:
         """Rebuild tabs for Global and Per-Device variables."""
-        self.tab_widget.clear()
-        self._device_tables.clear()
-        self._live_variables = []
-        
-        # 1. Global Tab
-        global_table = self._create_table()
-        self._device_tables[0] = global_table
-        global_vars = [v for v in self.variable_definitions if v.is_global]
-        
-        for v in global_vars:
-            live_v = v.copy()
-            self._live_variables.append(live_v)
+        # Suspend repaints while tabs are torn down and repopulated
+        self.tab_widget.setUpdatesEnabled(False)
+        try:
+            # QTabWidget.clear() only removes the pages, delete the old tables too
+            for index in range(self.tab_widget.count()):
+                self.tab_widget.widget(index).deleteLater()
+            self.tab_widget.clear()
+            self._device_tables.clear()
+            self._device_variables.clear()
+            self._live_variables = []
             
-        self._populate_table(global_table, global_vars)
-        self.tab_widget.addTab(global_table, "Global")
-        
-        # 2. Per-Device Tabs
-        device_vars = [v for v in self.variable_definitions if not v.is_global]
-        for sid in sorted(self.slave_ids):
-            table = self._create_table()
-            self._device_tables[sid] = table
+            # 1. Global Tab
+            global_table = self._create_table()
+            self._device_tables[0] = global_table
+            global_vars = [v for v in self.variable_definitions if v.is_global]
             
-            # Create live instances for this device
-            current_device_live = []
-            for v_def in device_vars:
-                live_v = v_def.copy()
-                live_v.slave_id = sid
-                # Contextualize expression for this device: R<addr> -> D<sid>.R<addr>
-                import re
-                live_v.expression = re.sub(r'(?<!\.)\bR(\d+)\b', f'D{sid}.R\\1', v_def.expression)
-                current_device_live.append(live_v)
+            for v in global_vars:
+                live_v = v.copy()
                 self._live_variables.append(live_v)
                 
-            self._populate_table(table, current_device_live)
-            self.tab_widget.addTab(table, f"Device {sid}")
+            self._populate_table(global_table, global_vars)
+            self._device_variables[0] = global_vars
+            self.tab_widget.addTab(global_table, "Global")
+            
+            # 2. Per-Device Tabs
+            device_vars = [v for v in self.variable_definitions if not v.is_global]
+            for sid in sorted(self.slave_ids):
+                table = self._create_table()
+                self._device_tables[sid] = table
+                
+                # Create live instances for this device
+                current_device_live = []
+                for v_def in device_vars:
+                    live_v = v_def.copy()
+                    live_v.slave_id = sid
+                    # Contextualize expression for this device: R<addr> -> D<sid>.R<addr>
+                    live_v.expression = localize_expression(v_def.expression, sid)
+                    current_device_live.append(live_v)
+                    self._live_variables.append(live_v)
+                    
+                self._populate_table(table, current_device_live)
+                self._device_variables[sid] = current_device_live
+                self.tab_widget.addTab(table, f"Device {sid}")
+        finally:
+            self.tab_widget.setUpdatesEnabled(True)
 
     def _populate_table(self, table: QTableWidget, variables: List[Variable]) -> None:
         """Populate a table with variables."""
@@ -182,11 +199,7 @@ class VariablesPanel(QFrame):
         """Update all live variable values."""
         # Map live variables to their table positions
         for sid, table in self._device_tables.items():
-            for row in range(table.rowCount()):
-                var = table.item(row, 0).data(Qt.ItemDataRole.UserRole)
-                if not var:
-                    continue
-                
+            for row, var in enumerate(self._device_variables.get(sid, [])):
                 value_item = table.item(row, 1)
                 if value_item is None:
                     continue
@@ -195,15 +208,19 @@ class VariablesPanel(QFrame):
                     value = self.evaluator.evaluate(var.expression)
                     var.value = value
                     var.error = None
-                    formatted = var.format_value(value)
-                    value_item.setText(formatted)
-                    value_item.setForeground(QBrush(QColor(COLORS['text_primary'])))
+                    text, brush, tooltip = var.format_value(value), _VALUE_BRUSH, None
                 except Exception as e:
                     var.value = None
                     var.error = str(e)
-                    value_item.setText("Error")
-                    value_item.setForeground(QBrush(QColor(COLORS['error'])))
-                    value_item.setToolTip(str(e))
+                    text, brush, tooltip = "Error", _ERROR_BRUSH, var.error
+                
+                # Unchanged cells are left alone so Qt doesn't repaint them
+                if value_item.text() != text:
+                    value_item.setText(text)
+                if value_item.foreground() != brush:
+                    value_item.setForeground(brush)
+                if tooltip is not None and value_item.toolTip() != tooltip:
+                    value_item.setToolTip(tooltip)
     
     def _add_variable(self) -> None:
         """Add a new variable definition."""
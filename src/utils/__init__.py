@@ -1,4 +1,4 @@
-from .serial_ports import get_available_ports
+from .serial_ports import get_available_ports, invalidate_ports_cache
 
 
 
@@ -2,17 +2,43 @@
 Serial port detection utilities.
 """
 
-import serial.tools.list_ports
+import time
 from typing import List, Tuple
 
 
-def get_available_ports() -> List[Tuple[str, str]]:
+# Serial line options offered in the connection and scan UIs
+BAUD_RATES = ("9600", "19200", "38400", "57600", "115200", "230400", "460800")
+PARITY_CODES = {"None": "N", "Even": "E", "Odd": "O"}  # UI label -> pyserial code
+PARITY_LABELS = {code: label for label, code in PARITY_CODES.items()}
+STOP_BITS = ("1", "2")
+
+# Enumeration walks the OS device tree, so results are reused for a short while
+PORT_CACHE_SECONDS = 2.0
+
+_port_cache: List[Tuple[str, str]] = []
+_port_cache_time = 0.0
+
+
+def get_available_ports(max_age: float = PORT_CACHE_SECONDS) -> List[Tuple[str, str]]:
     """
     Get list of available serial ports.
     
+    Args:
+        max_age: Reuse the last enumeration if it is younger than this (seconds).
+            Pass 0 to force a fresh enumeration.
+    
     Returns:
         List of tuples (port_name, description)
     """
+    global _port_cache, _port_cache_time
+    
+    now = time.monotonic()
+    if _port_cache_time and now - _port_cache_time < max_age:
+        return list(_port_cache)
+    
+    # Imported on first enumeration to keep it off the startup path
+    import serial.tools.list_ports
+    
     ports = []
     for port in serial.tools.list_ports.comports():
         description = port.description or port.device
@@ -20,7 +46,10 @@ def get_available_ports() -> List[Tuple[str, str]]:
     
     # Sort by port name
     ports.sort(key=lambda x: x[0])
-    return ports
+    
+    _port_cache = ports
+    _port_cache_time = now
+    return list(ports)
 
 
 def get_port_names() -> List[str]:
@@ -28,7 +57,8 @@ def get_port_names() -> List[str]:
     return [port[0] for port in get_available_ports()]
 
 
-
-
-
-
+def invalidate_ports_cache() -> None:
+    """Drop the cached enumeration so the next lookup walks the ports again."""
+    global _port_cache, _port_cache_time
+    _port_cache = []
+    _port_cache_time = 0.0